@@ -5,7 +5,7 @@ a = Analysis(
     ['src\\main.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('src\\dark.qss', '.')],
     hiddenimports=[
         'can.interfaces.pcan',
         'can.interfaces.virtual',
@@ -2,11 +2,14 @@
 CAN Manager - Handles PCAN connection and message handling
 """
 import can
+import collections
+import heapq
+import itertools
 import threading
 import time
-from typing import Callable, Optional, List, Dict
+from typing import Any, Callable, Optional, Iterable, List, Dict, Sequence, Tuple
 from dataclasses import dataclass, field
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+from PyQt6.QtCore import QObject, Qt, pyqtSignal, QTimer
 
 
 @dataclass
@@ -14,38 +17,74 @@ class ResponseRule:
     """Rule for auto-responding to CAN messages"""
     trigger_id: int
     response_id: int
-    response_data: List[int]
+    response_data: bytearray
     is_extended: bool = True
     delay_ms: int = 0
     comment: str = ""
     enabled: bool = True
     increment_byte: int = -1  # -1 = disabled, 0-7 = byte index to auto-increment
+    # Internal state: handle assigned by CANManager.add_response_rule
+    _handle: int = field(default=0, repr=False, compare=False)
+    # Internal state: frame reused for every response
+    _cached_msg: Optional[can.Message] = field(default=None, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Accept any byte sequence (e.g. List[int] from dialogs or JSON)
+        if not isinstance(self.response_data, bytearray):
+            self.response_data = bytearray(self.response_data)
 
 
 @dataclass
 class TransmitMessage:
     """Message for periodic transmission"""
     msg_id: int
-    data: List[int]
+    data: bytearray
     is_extended: bool = True
     cycle_time_ms: int = 100
     is_paused: bool = False
     comment: str = ""
     count: int = 0
     increment_byte: int = -1  # -1 = disabled, 0-7 = byte index to auto-increment
-    # Internal state
-    _timer: Optional[QTimer] = field(default=None, repr=False)
+    # Internal state: handle assigned by CANManager.add_transmit_message
+    _handle: int = field(default=0, repr=False, compare=False)
+    # Internal state: bumped to cancel any pending scheduler entry
+    _gen: int = field(default=0, repr=False)
+    # Internal state: frame reused for every periodic send
+    _cached_msg: Optional[can.Message] = field(default=None, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Accept any byte sequence (e.g. List[int] from dialogs or JSON)
+        if not isinstance(self.data, bytearray):
+            self.data = bytearray(self.data)
+
+
+class _RxSink(can.Listener):
+    """Forwards frames from the can.Notifier thread to CANManager"""
+    
+    def __init__(self, manager: "CANManager"):
+        self._manager = manager
+    
+    def on_message_received(self, msg: can.Message):
+        self._manager._on_frame(msg)
+    
+    def on_error(self, exc: Exception):
+        self._manager._on_rx_error(exc)
 
 
 class CANManager(QObject):
     """Manages PCAN-USB connection and CAN message handling"""
     
     # Signals for thread-safe GUI updates
-    message_received = pyqtSignal(object)  # can.Message
+    message_received = pyqtSignal(object)  # can.Message (deprecated, use messages_received)
+    messages_received = pyqtSignal(list)  # List[can.Message], one burst per emit
     connection_changed = pyqtSignal(bool, str)  # connected, status_text
-    message_sent = pyqtSignal(object)  # can.Message
+    # Sent frames: send_message/send_batch payloads are as sent. Periodic and auto-response
+    # frames are reused per message/rule, so their payload is the latest one sent
+    message_sent = pyqtSignal(object)  # can.Message (deprecated, use messages_sent)
+    messages_sent = pyqtSignal(list)  # List[can.Message], flushed every TX_FLUSH_MS
     error_occurred = pyqtSignal(str)
-    status_updated = pyqtSignal(dict)  # status info dict
+    status_updated = pyqtSignal(dict)  # status info dict (reused, copy to keep)
+    _rx_ready = pyqtSignal()  # internal: frames waiting in _rx_pending
     
     BITRATES = {
         "125 kbit/s": 125000,
@@ -60,28 +99,117 @@ class CANManager(QObject):
         "PCAN_USBBUS3",
         "PCAN_USBBUS4",
     ]
+    _channels: Optional[List[str]] = None  # see channels()/refresh_channels()
+    
+    # Idle receive wait of the Notifier thread (recv blocks on the driver's event)
+    RX_IDLE_TIMEOUT_S = 0.5
+    
+    # Sent frames are reported to the GUI in batches at this interval
+    TX_FLUSH_MS = 50
+    
+    # status_updated is emitted at most this often
+    STATUS_INTERVAL_MS = 100
+    
+    @classmethod
+    def channels(cls) -> List[str]:
+        """Channel names for the selector: the last probe result, else CHANNELS (no hardware access)"""
+        if cls._channels is None:
+            cls._channels = list(cls.CHANNELS)
+        return cls._channels
+    
+    @classmethod
+    def refresh_channels(cls) -> List[str]:
+        """Probe the driver for attached PCAN channels and cache them (falls back to CHANNELS)"""
+        try:
+            found = [str(config['channel']) for config in can.detect_available_configs(interfaces=['pcan'])]
+        except Exception:
+            found = []
+        cls._channels = found or list(cls.CHANNELS)
+        return cls._channels
     
     def __init__(self):
         super().__init__()
         self.bus: Optional[can.Bus] = None
+        self._connected = False  # plain attribute, read on every periodic tick / response
         self._running = False
-        self._receive_thread: Optional[threading.Thread] = None
-        self._response_rules: List[ResponseRule] = []
-        self._transmit_messages: List[TransmitMessage] = []
+        self._notifier: Optional[can.Notifier] = None
+        # Frames received on the Notifier thread, handed to the GUI thread in bursts:
+        # only the first frame after a flush emits _rx_ready.
+        self._rx_pending: List[can.Message] = []
+        self._rx_lock = threading.Lock()
+        self._rx_flush_pending = False
+        self._rx_ready.connect(self._flush_received, Qt.ConnectionType.QueuedConnection)
+        # Rules and messages are keyed by a handle assigned on add (insertion-ordered)
+        self._handle_seq = itertools.count(1)
+        self._response_rules: Dict[int, ResponseRule] = {}
+        # trigger_id lookup, rebuilt from _response_rules (enabled only) on
+        # the event loop after edits, or lazily by the receive thread.
+        # Each trigger maps to its responses in table order: (frame, None) for
+        # static rules (no delay, no increment), whose pre-built frame is sent
+        # as-is, and (frame, rule) for rules that go through _fire_response.
+        self._responses: Dict[int, List[Tuple[can.Message, Optional[ResponseRule]]]] = {}
+        # Prefilter checked in the receive loop before calling _check_and_respond
+        self._trigger_ids: frozenset = frozenset()
+        self._rules_dirty = True
+        self._rules_rebuild_queued = False
+        self._rules_lock = threading.Lock()
+        self._transmit_messages: Dict[int, TransmitMessage] = {}
+        # Bumped on every add/remove/update so views can skip unchanged lists;
+        # get_* hand out a tuple snapshot cached per version.
+        self._rules_version = 0
+        self._transmit_version = 0
+        self._rules_snapshot: Tuple[int, Tuple[ResponseRule, ...]] = (0, ())
+        self._transmit_snapshot: Tuple[int, Tuple[TransmitMessage, ...]] = (0, ())
+        # Scheduled sends: heap of (deadline, seq, callback, arg), run by one thread
+        self._scheduler_thread: Optional[threading.Thread] = None
+        self._schedule_heap: List[Tuple[float, int, Callable[[Any], None], Any]] = []
+        self._schedule_cond = threading.Condition()
+        self._schedule_seq = itertools.count()
+        # send_message frames per (arbitration_id, is_extended), with the _sent_flushes value
+        # when last queued; a frame is only rewritten in place once it has been reported
+        self._send_cache: Dict[Tuple[int, bool], Tuple[can.Message, int]] = {}
+        self._sent_flushes = 0  # bumped after each _flush_sent report
+        # Frames sent from any thread, drained into messages_sent by _tx_flush_timer
+        self._sent_pending: collections.deque = collections.deque()
+        self._tx_flush_timer = QTimer(self)
+        self._tx_flush_timer.timeout.connect(self._flush_sent)
         self._response_mode_enabled = False
         self._paused = False
         self._channel = ""
         self._bitrate = 0
         
-        # Statistics
+        # Statistics. TX/errors are bumped from several threads, so they are
+        # drawn from itertools.count (atomic under the GIL); RX only has the
+        # receive thread as writer.
         self._rx_count = 0
         self._tx_count = 0
         self._error_count = 0
         self._overruns = 0
+        self._tx_ctr = itertools.count(1)
+        self._error_ctr = itertools.count(1)
+        self._status = {
+            'channel': '',
+            'bitrate': 0,
+            'rx_count': 0,
+            'tx_count': 0,
+            'errors': 0,
+            'overruns': 0,
+            'status': 'Disconnected'
+        }
+        self._status_timer = QTimer(self)
+        self._status_timer.timeout.connect(self._emit_status)
         
     @property
     def is_connected(self) -> bool:
-        return self.bus is not None
+        return self._connected
+    
+    @property
+    def rules_version(self) -> int:
+        return self._rules_version
+    
+    @property
+    def transmit_version(self) -> int:
+        return self._transmit_version
     
     @property
     def response_mode_enabled(self) -> bool:
@@ -110,13 +238,19 @@ class CANManager(QObject):
             self._channel = channel
             self._bitrate = bitrate
             self._running = True
+            self._connected = True
             self._rx_count = 0
             self._tx_count = 0
             self._error_count = 0
             self._overruns = 0
+            self._tx_ctr = itertools.count(1)
+            self._error_ctr = itertools.count(1)
             
-            self._receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
-            self._receive_thread.start()
+            self._notifier = can.Notifier(self.bus, [_RxSink(self)], timeout=self.RX_IDLE_TIMEOUT_S)
+            self._scheduler_thread = threading.Thread(target=self._scheduler_loop, daemon=True)
+            self._scheduler_thread.start()
+            self._tx_flush_timer.start(self.TX_FLUSH_MS)
+            self._status_timer.start(self.STATUS_INTERVAL_MS)
             
             status = f"Connected to {channel} @ {bitrate // 1000} kbit/s"
             self.connection_changed.emit(True, status)
@@ -134,190 +268,442 @@ class CANManager(QObject):
         # Stop all periodic transmissions
         self.stop_all_transmissions()
         
+        self._connected = False
         self._running = False
-        if self._receive_thread:
-            self._receive_thread.join(timeout=2.0)
+        with self._schedule_cond:
+            self._schedule_heap.clear()
+            self._schedule_cond.notify_all()
+        if self._scheduler_thread:
+            self._scheduler_thread.join(timeout=2.0)
+        if self._notifier:
+            self._notifier.stop(timeout=2.0)
+            self._notifier = None
         if self.bus:
             self.bus.shutdown()
-            self.bus = None
+        self.bus = None
+        self._flush_received()
+        self._send_cache.clear()
+        self._tx_flush_timer.stop()
+        self._status_timer.stop()
+        self._flush_sent()
+        self._emit_status()
         self.connection_changed.emit(False, "Disconnected")
     
-    def send_message(self, arbitration_id: int, data: List[int], is_extended: bool = True) -> bool:
+    def send_message(self, arbitration_id: int, data: Sequence[int], is_extended: bool = True) -> bool:
         """Send a CAN message"""
         if not self.bus:
             return False
             
         try:
-            msg = can.Message(
-                arbitration_id=arbitration_id,
-                data=data,
-                is_extended_id=is_extended
-            )
+            msg = self._send_frame(arbitration_id, data, is_extended)
             self.bus.send(msg)
-            self._tx_count += 1
-            self.message_sent.emit(msg)
-            self._emit_status()
+            self._tx_count = next(self._tx_ctr)
+            self._sent_pending.append(msg)
             return True
         except Exception as e:
-            self._error_count += 1
+            self._error_count = next(self._error_ctr)
             self.error_occurred.emit(f"Send failed: {str(e)}")
-            self._emit_status()
             return False
     
+    def send_batch(self, frames: Iterable[Tuple[int, bytes, bool]]) -> int:
+        """
+        Send (arbitration_id, data, is_extended) frames back-to-back.
+        Stops at the first failure; returns how many were sent.
+        """
+        bus = self.bus
+        if not bus:
+            return 0
+        
+        sent = 0
+        try:
+            for arbitration_id, data, is_extended in frames:
+                msg = self._send_frame(arbitration_id, data, is_extended)
+                bus.send(msg)
+                self._tx_count = next(self._tx_ctr)
+                self._sent_pending.append(msg)
+                sent += 1
+        except Exception as e:
+            self._error_count = next(self._error_ctr)
+            self.error_occurred.emit(f"Send failed: {str(e)}")
+        return sent
+    
+    def _send_frame(self, arbitration_id: int, data, is_extended: bool) -> can.Message:
+        """Frame for (arbitration_id, is_extended) carrying data (main thread)"""
+        key = (arbitration_id, is_extended)
+        flushes = self._sent_flushes
+        cached = self._send_cache.get(key)
+        if cached is not None and cached[1] != flushes and len(cached[0].data) == len(data):
+            # Already reported by _flush_sent: safe to rewrite in place
+            msg = cached[0]
+            msg.data[:] = data
+        else:
+            # Still waiting in _sent_pending (or none yet): its payload must stay as sent
+            msg = can.Message(
+                arbitration_id=arbitration_id,
+                data=bytearray(data),
+                is_extended_id=is_extended
+            )
+        self._send_cache[key] = (msg, flushes)
+        return msg
+    
     def _emit_status(self):
-        """Emit current status"""
-        status = {
-            'channel': self._channel,
-            'bitrate': self._bitrate,
-            'rx_count': self._rx_count,
-            'tx_count': self._tx_count,
-            'errors': self._error_count,
-            'overruns': self._overruns,
-            'status': 'OK' if self.is_connected else 'Disconnected'
-        }
+        """
+        Emit current status (main thread only).
+        The same dict is updated and re-emitted each time; receivers must copy it to keep it.
+        """
+        status = self._status
+        status['channel'] = self._channel
+        status['bitrate'] = self._bitrate
+        status['rx_count'] = self._rx_count
+        status['tx_count'] = self._tx_count
+        status['errors'] = self._error_count
+        status['overruns'] = self._overruns
+        status['status'] = 'OK' if self._connected else 'Disconnected'
         self.status_updated.emit(status)
     
+    def _flush_sent(self):
+        """Report frames sent since the last flush to the GUI (main thread)"""
+        pending = self._sent_pending
+        if not pending:
+            return
+        batch = [pending.popleft() for _ in range(len(pending))]
+        self.messages_sent.emit(batch)
+        if self.receivers(self.message_sent):
+            for msg in batch:
+                self.message_sent.emit(msg)
+        self._sent_flushes += 1
+    
     # === Response Rules ===
     
-    def add_response_rule(self, rule: ResponseRule):
-        """Add a response rule"""
-        self._response_rules.append(rule)
+    def add_response_rule(self, rule: ResponseRule) -> int:
+        """Add a response rule, returning its handle"""
+        with self._rules_lock:
+            rule._handle = next(self._handle_seq)
+            self._response_rules[rule._handle] = rule
+            self._rules_version += 1
+            self._mark_rules_dirty()
+        return rule._handle
     
     def remove_response_rule(self, index: int):
         """Remove a response rule by index"""
-        if 0 <= index < len(self._response_rules):
-            self._response_rules.pop(index)
+        rules = self.get_response_rules()
+        if 0 <= index < len(rules):
+            self.remove_response_rule_by_handle(rules[index]._handle)
     
-    def get_response_rules(self) -> List[ResponseRule]:
-        """Get all response rules"""
-        return self._response_rules.copy()
+    def remove_response_rule_by_handle(self, handle: int):
+        """Remove a response rule by handle"""
+        with self._rules_lock:
+            if self._response_rules.pop(handle, None) is not None:
+                self._rules_version += 1
+                self._mark_rules_dirty()
+    
+    def get_response_rules(self) -> Tuple[ResponseRule, ...]:
+        """Get all response rules (immutable snapshot)"""
+        version, rules = self._rules_snapshot
+        if version != self._rules_version:
+            with self._rules_lock:
+                rules = tuple(self._response_rules.values())
+                self._rules_snapshot = (self._rules_version, rules)
+        return rules
     
     def clear_response_rules(self):
         """Clear all response rules"""
-        self._response_rules.clear()
+        with self._rules_lock:
+            self._response_rules.clear()
+            self._rules_version += 1
+            self._mark_rules_dirty()
     
     def update_response_rule(self, index: int, rule: ResponseRule):
         """Update a response rule at the given index"""
-        if 0 <= index < len(self._response_rules):
-            self._response_rules[index] = rule
+        rules = self.get_response_rules()
+        if 0 <= index < len(rules):
+            self.update_response_rule_by_handle(rules[index]._handle, rule)
+    
+    def update_response_rule_by_handle(self, handle: int, rule: ResponseRule):
+        """Replace the response rule with the given handle, keeping its position"""
+        with self._rules_lock:
+            if handle in self._response_rules:
+                rule._handle = handle
+                self._response_rules[handle] = rule
+                self._rules_version += 1
+                self._mark_rules_dirty()
+    
+    def set_rule_enabled(self, index: int, enabled: bool):
+        """Enable or disable a response rule; disabled rules are left out of the index"""
+        rules = self.get_response_rules()
+        if 0 <= index < len(rules) and rules[index].enabled != enabled:
+            with self._rules_lock:
+                rules[index].enabled = enabled
+                self._mark_rules_dirty()
+    
+    def _mark_rules_dirty(self):
+        """Flag the rule index stale and queue one rebuild for the next event loop pass"""
+        self._rules_dirty = True
+        if not self._rules_rebuild_queued:
+            self._rules_rebuild_queued = True
+            # Bulk loads coalesce into a single rebuild on the GUI thread, so
+            # the receive thread only falls back to rebuilding if a frame
+            # arrives before the queued call runs
+            QTimer.singleShot(0, self.rebuild_rule_index)
+    
+    def rebuild_rule_index(self):
+        """Rebuild the trigger_id lookup now if any rule changed"""
+        self._rules_rebuild_queued = False
+        if self._rules_dirty:
+            self._rebuild_rule_index()
+    
+    def _rebuild_rule_index(self):
+        """Rebuild the trigger_id lookup (enabled rules only, in table order)"""
+        with self._rules_lock:
+            responses: Dict[int, List[Tuple[can.Message, Optional[ResponseRule]]]] = {}
+            for rule in self._response_rules.values():
+                if not rule.enabled:
+                    continue
+                if rule.delay_ms <= 0 and rule.increment_byte < 0:
+                    # Static: a private copy of the payload, sent as-is
+                    entry = (can.Message(
+                        arbitration_id=rule.response_id,
+                        data=bytes(rule.response_data),
+                        is_extended_id=rule.is_extended
+                    ), None)
+                else:
+                    rule._cached_msg = can.Message(
+                        arbitration_id=rule.response_id,
+                        data=rule.response_data,  # shared buffer
+                        is_extended_id=rule.is_extended
+                    )
+                    entry = (rule._cached_msg, rule)
+                responses.setdefault(rule.trigger_id, []).append(entry)
+            self._responses = responses
+            self._trigger_ids = frozenset(responses)
+            self._rules_dirty = False
     
     # === Transmit Messages (Periodic) ===
     
-    def add_transmit_message(self, msg: TransmitMessage):
-        """Add a periodic transmit message"""
-        self._transmit_messages.append(msg)
-        if not msg.is_paused and self.is_connected:
-            self._start_transmit_timer(msg)
+    def add_transmit_message(self, msg: TransmitMessage) -> int:
+        """Add a periodic transmit message, returning its handle"""
+        msg._handle = next(self._handle_seq)
+        self._transmit_messages[msg._handle] = msg
+        self._transmit_version += 1
+        if not msg.is_paused and self._connected:
+            self._start_transmit(msg)
+        return msg._handle
     
     def remove_transmit_message(self, index: int):
         """Remove a transmit message by index"""
-        if 0 <= index < len(self._transmit_messages):
-            msg = self._transmit_messages[index]
-            if msg._timer:
-                msg._timer.stop()
-                msg._timer = None
-            self._transmit_messages.pop(index)
+        messages = self.get_transmit_messages()
+        if 0 <= index < len(messages):
+            self.remove_transmit_message_by_handle(messages[index]._handle)
     
-    def get_transmit_messages(self) -> List[TransmitMessage]:
-        """Get all transmit messages"""
-        return self._transmit_messages.copy()
+    def remove_transmit_message_by_handle(self, handle: int):
+        """Remove a transmit message by handle"""
+        msg = self._transmit_messages.pop(handle, None)
+        if msg is not None:
+            msg._gen += 1
+            self._transmit_version += 1
+    
+    def get_transmit_messages(self) -> Tuple[TransmitMessage, ...]:
+        """Get all transmit messages (immutable snapshot)"""
+        version, messages = self._transmit_snapshot
+        if version != self._transmit_version:
+            messages = tuple(self._transmit_messages.values())
+            self._transmit_snapshot = (self._transmit_version, messages)
+        return messages
     
     def toggle_transmit_message(self, index: int):
         """Toggle pause state of a transmit message"""
-        if 0 <= index < len(self._transmit_messages):
-            msg = self._transmit_messages[index]
+        messages = self.get_transmit_messages()
+        if 0 <= index < len(messages):
+            msg = messages[index]
             msg.is_paused = not msg.is_paused
             
             if msg.is_paused:
-                if msg._timer:
-                    msg._timer.stop()
+                msg._gen += 1
             else:
-                if self.is_connected:
-                    self._start_transmit_timer(msg)
+                if self._connected:
+                    self._start_transmit(msg)
     
     def send_transmit_message_once(self, index: int):
         """Send a transmit message once (manual trigger)"""
-        if 0 <= index < len(self._transmit_messages):
-            msg = self._transmit_messages[index]
+        messages = self.get_transmit_messages()
+        if 0 <= index < len(messages):
+            msg = messages[index]
             self.send_message(msg.msg_id, msg.data, msg.is_extended)
             msg.count += 1
     
-    def _start_transmit_timer(self, msg: TransmitMessage):
-        """Start periodic transmission for a message"""
-        if msg._timer:
-            msg._timer.stop()
+    def _start_transmit(self, msg: TransmitMessage):
+        """Start periodic transmission for a message (cycle 0 = manual only)"""
+        msg._gen += 1
+        if msg.cycle_time_ms <= 0:
+            return
+        if msg._cached_msg is None:
+            msg._cached_msg = can.Message(
+                arbitration_id=msg.msg_id,
+                data=msg.data,  # shared buffer
+                is_extended_id=msg.is_extended
+            )
+        deadline = time.monotonic() + msg.cycle_time_ms / 1000.0
+        self._schedule(deadline, self._send_periodic, (msg, msg._gen, deadline))
+    
+    def _send_periodic(self, entry: Tuple[TransmitMessage, int, float]):
+        """Send a periodic message, with optional byte auto-increment (scheduler thread)"""
+        msg, gen, deadline = entry
+        if gen != msg._gen or msg.is_paused or not self._connected:
+            return
+        bus = self.bus
         
-        msg._timer = QTimer()
-        msg._timer.timeout.connect(lambda: self._send_periodic(msg))
-        msg._timer.start(msg.cycle_time_ms)
-    
-    def _send_periodic(self, msg: TransmitMessage):
-        """Send a periodic message, with optional byte auto-increment"""
-        if not msg.is_paused and self.is_connected:
-            # Auto-increment the chosen byte before sending
-            if 0 <= msg.increment_byte < len(msg.data):
-                msg.data[msg.increment_byte] = (msg.data[msg.increment_byte] + 1) & 0xFF
-            self.send_message(msg.msg_id, msg.data, msg.is_extended)
+        # Auto-increment the chosen byte in place (frame and msg share the buffer)
+        frame = msg._cached_msg
+        data = frame.data
+        inc = msg.increment_byte
+        if 0 <= inc < len(data):
+            data[inc] = (data[inc] + 1) & 0xFF
+        if self._fast_send(bus, frame):
             msg.count += 1
+        
+        # Keep a fixed cadence; resync if we fell more than a cycle behind
+        period = msg.cycle_time_ms / 1000.0
+        deadline += period
+        now = time.monotonic()
+        if deadline < now:
+            deadline = now + period
+        self._schedule(deadline, self._send_periodic, (msg, gen, deadline))
     
     def stop_all_transmissions(self):
         """Stop all periodic transmissions"""
-        for msg in self._transmit_messages:
-            if msg._timer:
-                msg._timer.stop()
-                msg._timer = None
+        for msg in self._transmit_messages.values():
+            msg._gen += 1
     
     def start_all_transmissions(self):
         """Start all non-paused transmissions"""
-        for msg in self._transmit_messages:
+        for msg in self._transmit_messages.values():
             if not msg.is_paused:
-                self._start_transmit_timer(msg)
+                self._start_transmit(msg)
     
     def clear_transmit_messages(self):
         """Clear all transmit messages"""
         self.stop_all_transmissions()
         self._transmit_messages.clear()
+        self._transmit_version += 1
+    
+    # === Scheduler ===
     
-    # === Receive Loop ===
-    
-    def _receive_loop(self):
-        """Background thread for receiving CAN messages"""
-        while self._running and self.bus:
-            try:
-                msg = self.bus.recv(timeout=0.1)
-                if msg and not self._paused:
-                    self._rx_count += 1
-                    self.message_received.emit(msg)
-                    
-                    # Check for auto-response
-                    if self._response_mode_enabled:
-                        self._check_and_respond(msg)
-                        
-            except Exception as e:
-                if self._running:
-                    self._error_count += 1
-                    self.error_occurred.emit(f"Receive error: {str(e)}")
+    def _schedule(self, deadline: float, callback: Callable[[Any], None], arg: Any):
+        """Run callback(arg) on the scheduler thread at the given monotonic time"""
+        with self._schedule_cond:
+            heapq.heappush(self._schedule_heap, (deadline, next(self._schedule_seq), callback, arg))
+            self._schedule_cond.notify()
+    
+    def _scheduler_loop(self):
+        """Background thread running scheduled sends in deadline order"""
+        heap = self._schedule_heap
+        cond = self._schedule_cond
+        while self._running:
+            with cond:
+                if not heap:
+                    cond.wait()
+                    continue
+                now = time.monotonic()
+                wait = heap[0][0] - now
+                if wait > 0:
+                    cond.wait(wait)
+                    continue
+                # Take every entry that is due in one pass under the lock;
+                # messages sharing a cycle come due together
+                due = [heapq.heappop(heap)]
+                while heap and heap[0][0] <= now:
+                    due.append(heapq.heappop(heap))
+            for _, _, callback, arg in due:
+                callback(arg)
+    
+    # === Receive ===
+    
+    def _on_frame(self, msg: can.Message):
+        """Handle one received frame (Notifier thread)"""
+        if self._paused:
+            return
+        
+        # Check for auto-response; most IDs on a busy bus trigger nothing
+        if self._response_mode_enabled:
+            if self._rules_dirty:
+                self._rebuild_rule_index()
+            if msg.arbitration_id in self._trigger_ids:
+                self._check_and_respond(msg)
+        
+        self._rx_count += 1
+        with self._rx_lock:
+            self._rx_pending.append(msg)
+            if self._rx_flush_pending:
+                return
+            self._rx_flush_pending = True
+        self._rx_ready.emit()
+    
+    def _on_rx_error(self, exc: Exception):
+        """Handle a receive error raised on the Notifier thread"""
+        if self._running:
+            self._error_count = next(self._error_ctr)
+            self.error_occurred.emit(f"Receive error: {str(exc)}")
+    
+    def _flush_received(self):
+        """Emit everything received since the last flush as one burst (main thread)"""
+        with self._rx_lock:
+            batch = self._rx_pending
+            if not batch:
+                return
+            self._rx_pending = []
+            self._rx_flush_pending = False
+        self.messages_received.emit(batch)
+        if self.receivers(self.message_received):
+            for msg in batch:
+                self.message_received.emit(msg)
     
     def _check_and_respond(self, received_msg: can.Message):
-        """Check if received message triggers a response"""
-        for rule in self._response_rules:
-            if not rule.enabled:
-                continue
-                
-            if received_msg.arbitration_id == rule.trigger_id:
-                # Apply delay if specified
-                if rule.delay_ms > 0:
-                    time.sleep(rule.delay_ms / 1000.0)
-                
-                # Auto-increment chosen byte before responding
-                if 0 <= rule.increment_byte < len(rule.response_data):
-                    rule.response_data[rule.increment_byte] = (
-                        rule.response_data[rule.increment_byte] + 1
-                    ) & 0xFF
-                
-                # Send response
-                self.send_message(
-                    rule.response_id,
-                    rule.response_data,
-                    rule.is_extended
-                )
+        """Send the responses for a received message whose ID is in _trigger_ids"""
+        # Every enabled rule for the trigger fires, in rules-table order (delayed ones
+        # are scheduled in that order). There is no first-match search to shortcut,
+        # so the list is deliberately not reordered by hit count.
+        responses = self._responses.get(received_msg.arbitration_id)
+        if not responses or not self._connected:
+            return
+        bus = self.bus
+        fast_send = self._fast_send
+        for frame, rule in responses:
+            if rule is None:
+                # Static response: send the pre-built frame as-is
+                fast_send(bus, frame)
+            elif rule.delay_ms > 0:
+                # Delayed responses run on the scheduler thread so RX never blocks
+                self._schedule(time.monotonic() + rule.delay_ms / 1000.0,
+                               self._fire_response, rule)
+            else:
+                self._fire_response(rule)
+    
+    def _fire_response(self, rule: ResponseRule):
+        """Send the response for a triggered rule"""
+        if not self._connected:
+            return
+        bus = self.bus
+        
+        # Auto-increment chosen byte in place before responding
+        frame = rule._cached_msg
+        data = frame.data
+        inc = rule.increment_byte
+        if 0 <= inc < len(data):
+            data[inc] = (data[inc] + 1) & 0xFF
+        
+        self._fast_send(bus, frame)
+    
+    def _fast_send(self, bus: can.BusABC, frame: can.Message) -> bool:
+        """
+        Send a pre-built frame from a worker thread.
+        Only bumps counters and queues the frame for the batched messages_sent flush.
+        """
+        try:
+            bus.send(frame)
+        except Exception as e:
+            self._error_count = next(self._error_ctr)
+            self.error_occurred.emit(f"Send failed: {str(e)}")
+            return False
+        self._tx_count = next(self._tx_ctr)
+        self._sent_pending.append(frame)
+        return True
@@ -2,41 +2,134 @@
 Main Window - CANtroller application interface
 """
 import time
-import re
 import json
 import os
 import sys
 import csv
+import bisect
+import struct
+from collections import OrderedDict, defaultdict
 from datetime import datetime
-from typing import Dict, Optional, List
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Optional, List, Tuple
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QTableWidget, QTableWidgetItem, QToolBar, QStatusBar, QLabel,
+    QTableWidget, QTableWidgetItem, QTableView, QToolBar, QStatusBar, QLabel,
     QComboBox, QPushButton, QGroupBox, QHeaderView, QMessageBox,
     QDialog, QFormLayout, QLineEdit, QCheckBox, QSpinBox, QDialogButtonBox,
     QMenu, QMenuBar, QTabWidget, QFrame, QFileDialog, QApplication,
     QProgressBar, QSlider, QGridLayout
 )
-from PyQt6.QtCore import Qt, QTimer, QMimeData
-from PyQt6.QtGui import QAction, QIcon, QColor, QFont, QDragEnterEvent, QDropEvent
+from PyQt6.QtCore import (
+    Qt, QTimer, QMimeData, QAbstractTableModel, QModelIndex, QObject, QRunnable,
+    QThreadPool, pyqtSignal
+)
+from PyQt6.QtGui import QAction, QIcon, QBrush, QColor, QFont, QDragEnterEvent, QDropEvent
 import can
 
 from can_manager import CANManager, ResponseRule, TransmitMessage
 from simulator import SimulationEngine, TripProfileGenerator
 
 # Settings file path - use app directory for PyInstaller compatibility
-def get_settings_path():
+def get_settings_path() -> Path:
     if getattr(sys, 'frozen', False):
         # Running as PyInstaller bundle
-        app_dir = os.path.dirname(sys.executable)
+        app_dir = Path(sys.executable).parent
     else:
         # Running from source
-        app_dir = os.path.dirname(__file__)
-    return os.path.join(app_dir, 'settings.json')
+        app_dir = Path(__file__).parent
+    return app_dir / 'settings.json'
 
 SETTINGS_FILE = get_settings_path()
 
 
+class _HexFilter(dict):
+    """str.translate table: hex digits map to uppercase, everything else is dropped"""
+    
+    def __missing__(self, key):
+        return None
+
+
+_HEX_FILTER = _HexFilter({ord(c): c.upper() for c in '0123456789abcdefABCDEF'})
+
+# Config file extensions accepted by drag and drop
+_SUPPORTED_EXTS = ('.cantroller', '.json')
+
+# str.translate table: drops replacement characters and em dashes from signal names/units
+_SIGNAL_TEXT_JUNK = str.maketrans('', '', '\ufffd\u2014')
+
+
+def parse_hex_bytes(text: str) -> List[int]:
+    """Parse space-separated hex bytes (e.g. "03 E8 00") into ints"""
+    try:
+        # Whole string in one C-level pass
+        return list(bytes.fromhex(text))
+    except ValueError:
+        # Single-nibble groups ("3 E8") or junk: token by token, errors name the token
+        return [int(b, 16) for b in text.split()]
+
+
+def parse_hex_id(text: str) -> int:
+    """Parse a CAN ID written as '18F81280', '0x18F81280' or '18F81280h' (int() takes the 0x and spaces)"""
+    return int(text.rstrip().removesuffix('h'), 16)
+
+
+_encode_json = json.JSONEncoder().encode
+
+# Classic CAN's full 8-byte payload as one big-endian integer (faster than int.from_bytes)
+_unpack_u64 = struct.Struct('>Q').unpack
+
+
+def _int_keyed(stored) -> dict:
+    """Rebuild an int-keyed database saved as [id, value] pairs (or, from older files, a str-keyed object)"""
+    if isinstance(stored, dict):
+        return {int(k): v for k, v in stored.items()}
+    return dict(stored)
+
+
+def dumps_config(config: dict) -> str:
+    """
+    Serialize a .cantroller config: indented at the top level, one line per
+    message/rule so every entry goes through the C encoder in a single call.
+    (json.dumps with indent= falls back to the pure-Python encoder.)
+    """
+    fields = []
+    for key, value in config.items():
+        if isinstance(value, list) and value:
+            entries = ",\n".join("    " + _encode_json(entry) for entry in value)
+            value_text = f"[\n{entries}\n  ]"
+        else:
+            value_text = _encode_json(value)
+        fields.append(f"  {_encode_json(key)}: {value_text}")
+    return "{\n" + ",\n".join(fields) + "\n}"
+
+
+class _FileTaskSignals(QObject):
+    """Signals for _FileTask (QRunnable is not a QObject)"""
+    finished = pyqtSignal(str, object)  # filename, task result
+    failed = pyqtSignal(str, str)  # filename, error message
+
+
+class _FileTask(QRunnable):
+    """Run a file reader/writer (database import, log export) on the global thread pool"""
+    
+    def __init__(self, task: Callable[[str], object], filename: str):
+        super().__init__()
+        self.task = task
+        self.filename = filename
+        self.signals = _FileTaskSignals()
+    
+    def run(self):
+        try:
+            result = self.task(self.filename)
+        except Exception as e:
+            self.signals.failed.emit(self.filename, str(e))
+        else:
+            self.signals.finished.emit(self.filename, result)
+
+
 class HexDataLineEdit(QLineEdit):
     """Custom QLineEdit that auto-formats hex data with spaces"""
     
@@ -45,6 +138,9 @@ class HexDataLineEdit(QLineEdit):
         self.setPlaceholderText(placeholder)
         self.textChanged.connect(self._on_text_changed)
         self._updating = False
+        # Last clean hex digits / formatted text we displayed (for the append fast path)
+        self._last_clean = ""
+        self._last_formatted = ""
     
     def _on_text_changed(self, text: str):
         if self._updating:
@@ -52,12 +148,22 @@ class HexDataLineEdit(QLineEdit):
         
         self._updating = True
         
-        # Remove all spaces and non-hex characters
-        clean = re.sub(r'[^0-9A-Fa-f]', '', text)
+        # Remove all spaces and non-hex characters (uppercasing in the same pass)
+        clean = text.translate(_HEX_FILTER)
         
-        # Split into pairs and join with spaces
-        pairs = [clean[i:i+2] for i in range(0, len(clean), 2)]
-        formatted = ' '.join(pairs).upper()
+        last_clean = self._last_clean
+        if (len(clean) - len(last_clean) in (1, 2) and clean.startswith(last_clean)
+                and text.startswith(self._last_formatted)):
+            # Typed at the end: extend the previous formatting instead of re-pairing it all
+            formatted = self._last_formatted
+            for i in range(len(last_clean), len(clean)):
+                formatted += clean[i] if i % 2 else (' ' + clean[i] if i else clean[i])
+        else:
+            # Split into pairs and join with spaces
+            pairs = [clean[i:i+2] for i in range(0, len(clean), 2)]
+            formatted = ' '.join(pairs)
+        self._last_clean = clean
+        self._last_formatted = formatted
         
         # Preserve cursor position
         cursor_pos = self.cursorPosition()
@@ -96,7 +202,7 @@ class HexByteLineEdit(QLineEdit):
         self._updating = True
         
         # Keep only hex characters
-        clean = re.sub(r'[^0-9A-Fa-f]', '', text).upper()
+        clean = text.translate(_HEX_FILTER)
         self.setText(clean)
         
         # Auto-advance to next field when 2 chars entered
@@ -167,7 +273,7 @@ class AddRuleDialog(QDialog):
         if rule:
             self.trigger_id_edit.setText(f"{rule.trigger_id:X}")
             self.response_id_edit.setText(f"{rule.response_id:X}")
-            self.response_data_edit.setText(" ".join(f"{b:02X}" for b in rule.response_data))
+            self.response_data_edit.setText(rule.response_data.hex(' ').upper())
             self.extended_check.setChecked(rule.is_extended)
             self.delay_spin.setValue(rule.delay_ms)
             self.comment_edit.setText(rule.comment)
@@ -198,7 +304,7 @@ class AddRuleDialog(QDialog):
             
             # Parse data bytes
             data_text = self.response_data_edit.text().strip()
-            data_bytes = [int(b, 16) for b in data_text.split()] if data_text else []
+            data_bytes = parse_hex_bytes(data_text) if data_text else []
             
             if len(data_bytes) > 8:
                 raise ValueError("Data must be 8 bytes or less")
@@ -375,13 +481,10 @@ class NewTransmitMessageDialog(QDialog):
             msg_id = int(id_text, 16)
             length = int(self.length_combo.currentText())
             
-            # Parse data bytes
-            data_bytes = []
-            for i in range(length):
-                byte_text = self.data_edits[i].text().strip()
-                if not byte_text:
-                    byte_text = "00"
-                data_bytes.append(int(byte_text, 16))
+            # Parse data bytes (empty fields count as 00)
+            data_bytes = parse_hex_bytes(" ".join(
+                self.data_edits[i].text().strip() or "00" for i in range(length)
+            ))
             
             return TransmitMessage(
                 msg_id=msg_id,
@@ -401,9 +504,243 @@ class NewTransmitMessageDialog(QDialog):
         return getattr(self, '_valid_msg', None)
 
 
+class _ClockText:
+    """
+    Formats epoch seconds as local wall-clock 'HH:MM:SS.mmm'.
+    datetime only runs once per local hour; within it the text is integer math.
+    """
+    
+    def __init__(self):
+        self._hour_start = 0  # epoch second the cached local hour began
+        self._hour_text = ""  # its 'HH:' prefix
+    
+    def format(self, t: float) -> str:
+        offset = t - self._hour_start
+        if not 0 <= offset < 3600:
+            # Whole seconds, so the cached hour start is exact
+            sec = int(t)
+            local = datetime.fromtimestamp(sec)
+            self._hour_start = sec - local.minute * 60 - local.second
+            self._hour_text = f"{local.hour:02d}:"
+            offset = t - self._hour_start
+        minutes, seconds = divmod(int(offset), 60)
+        return f"{self._hour_text}{minutes:02d}:{seconds:02d}.{int((t % 1) * 1000):03d}"
+
+
+class _RxEntry:
+    """Receive state of one CAN ID: last frame, frame count and first/last receive time"""
+    
+    __slots__ = ('msg', 'count', 'first_time', 'last_time')
+    
+    def __init__(self, msg: can.Message, t: float):
+        self.msg = msg
+        self.count = 1
+        self.first_time = t
+        self.last_time = t
+
+
+class ReceiveModel(QAbstractTableModel):
+    """
+    Table model over MainWindow.receive_messages (one row per CAN ID).
+    Cells are formatted on demand, so only the rows on screen cost anything.
+    """
+    
+    HEADERS = ["Timestamp", "CAN-ID", "Name", "Type", "Length", "Data", "Cycle Time", "Count"]
+    DATA_COLUMN = 5
+    _CENTERED = frozenset((0, 1, 3, 4, 6, 7))
+    
+    def __init__(self, entries: Dict[int, _RxEntry],
+                 name_for: Callable[[int], str],
+                 format_data: Callable[[int, can.Message], str],
+                 parent=None):
+        super().__init__(parent)
+        self._entries = entries
+        self._name_for = name_for
+        self._format_data = format_data
+        self._ids: List[int] = []  # visible CAN IDs, in row order
+        self._rows: Dict[int, int] = {}  # CAN ID -> row
+        # CAN ID -> (CAN-ID text, name); stable until the ID database changes
+        self._labels: Dict[int, Tuple[str, str]] = {}
+        # CAN ID -> (payload, Data column text) for the payload last formatted
+        self._data_text: Dict[int, Tuple[bytearray, str]] = {}
+        # CAN ID -> (last_time, Timestamp column text)
+        self._time_text: Dict[int, Tuple[float, str]] = {}
+        self._clock = _ClockText()
+        self._headers = list(self.HEADERS)
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._ids)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return None
+    
+    def set_data_header(self, text: str):
+        """Relabel the Data column (shows the current display mode)"""
+        self._headers[self.DATA_COLUMN] = text
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, self.DATA_COLUMN, self.DATA_COLUMN)
+        self.clear_data_text()
+    
+    def visible_ids(self) -> List[int]:
+        """CAN IDs currently shown, in row order (a copy)"""
+        return list(self._ids)
+    
+    def msg_id_at(self, row: int) -> Optional[int]:
+        return self._ids[row] if 0 <= row < len(self._ids) else None
+    
+    def row_of(self, msg_id: int) -> int:
+        return self._rows.get(msg_id, -1)
+    
+    def clear_labels(self):
+        """Drop cached CAN-ID/name strings (after the ID database changes)"""
+        self._labels.clear()
+        if self._ids:
+            self.dataChanged.emit(self.index(0, 1), self.index(len(self._ids) - 1, 2),
+                                  [Qt.ItemDataRole.DisplayRole])
+    
+    def clear_data_text(self):
+        """Drop cached Data column text (after the display mode or signal database changes)"""
+        self._data_text.clear()
+        if self._ids:
+            self.dataChanged.emit(self.index(0, self.DATA_COLUMN),
+                                  self.index(len(self._ids) - 1, self.DATA_COLUMN),
+                                  [Qt.ItemDataRole.DisplayRole])
+    
+    def id_text(self, msg_id: int, msg: can.Message) -> str:
+        """CAN-ID column text (e.g. '18F81280h'), cached per ID"""
+        return self._labels_of(msg_id, msg)[0]
+    
+    def _labels_of(self, msg_id: int, msg: can.Message) -> Tuple[str, str]:
+        labels = self._labels.get(msg_id)
+        if labels is None:
+            labels = self._labels[msg_id] = (
+                f"{msg_id:08X}h" if msg.is_extended_id else f"{msg_id:03X}h",
+                self._name_for(msg_id)
+            )
+        return labels
+    
+    def refresh_ids(self, msg_ids):
+        """Repaint the rows of the given CAN IDs (one dataChanged over their span)"""
+        rows = self._rows
+        touched = [rows[i] for i in msg_ids if i in rows]
+        if touched:
+            self.dataChanged.emit(self.index(min(touched), 0),
+                                  self.index(max(touched), len(self._headers) - 1),
+                                  [Qt.ItemDataRole.DisplayRole])
+    
+    def insert_ids(self, new_ids: List[int]):
+        """Insert CAN IDs at their sorted rows without resetting the view"""
+        ids = self._ids
+        rows = self._rows
+        for msg_id in sorted(new_ids):
+            if msg_id in rows:
+                continue
+            row = bisect.bisect_left(ids, msg_id)
+            self.beginInsertRows(QModelIndex(), row, row)
+            ids.insert(row, msg_id)
+            rows[msg_id] = row
+            self.endInsertRows()
+        if new_ids:
+            self._rows = {msg_id: row for row, msg_id in enumerate(ids)}
+    
+    def remove_ids(self, old_ids):
+        """Remove CAN IDs' rows (and their cached text) without resetting the view"""
+        ids = self._ids
+        rows = self._rows
+        removed = False
+        for msg_id in old_ids:
+            self._labels.pop(msg_id, None)
+            self._data_text.pop(msg_id, None)
+            self._time_text.pop(msg_id, None)
+            if msg_id not in rows:
+                continue
+            row = bisect.bisect_left(ids, msg_id)
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del ids[row]
+            del rows[msg_id]
+            self.endRemoveRows()
+            removed = True
+        if removed:
+            self._rows = {msg_id: row for row, msg_id in enumerate(ids)}
+    
+    def set_ids(self, ids: List[int]):
+        """Show the given CAN IDs; same rows only repaints, a new row set resets the view"""
+        if ids == self._ids:
+            if ids:
+                self.dataChanged.emit(self.index(0, 0),
+                                      self.index(len(ids) - 1, len(self._headers) - 1),
+                                      [Qt.ItemDataRole.DisplayRole])
+            return
+        self.beginResetModel()
+        self._ids = ids
+        self._rows = {msg_id: row for row, msg_id in enumerate(ids)}
+        self.endResetModel()
+    
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        col = index.column()
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter if col in self._CENTERED else None
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        
+        msg_id = self._ids[index.row()]
+        entry = self._entries.get(msg_id)
+        if entry is None:
+            return None
+        msg = entry.msg
+        
+        if col == 0:  # Timestamp, formatted once per receive time
+            last_time = entry.last_time
+            cached = self._time_text.get(msg_id)
+            if cached is not None and cached[0] == last_time:
+                return cached[1]
+            text = self._clock.format(last_time)
+            self._time_text[msg_id] = (last_time, text)
+            return text
+        if col == 1:  # CAN-ID
+            return self._labels_of(msg_id, msg)[0]
+        if col == 2:  # Name (from database)
+            return self._labels_of(msg_id, msg)[1]
+        if col == 3:  # Type
+            return "Ext" if msg.is_extended_id else "Std"
+        if col == 4:  # Length
+            return str(len(msg.data))
+        if col == 5:  # Data (HEX, Decimal, or Decoded), formatted once per distinct payload
+            data = msg.data
+            cached = self._data_text.get(msg_id)
+            if cached is not None and cached[0] == data:
+                return cached[1]
+            text = self._format_data(msg_id, msg)
+            self._data_text[msg_id] = (data, text)
+            return text
+        if col == 6:  # Cycle Time (calculated from count and time span)
+            count = entry.count
+            if count > 1:
+                time_span = entry.last_time - entry.first_time
+                if time_span > 0:
+                    return f"{(time_span / (count - 1)) * 1000:.1f}"
+            return "-"
+        if col == 7:  # Count
+            return str(entry.count)
+        return None
+
+
 class MainWindow(QMainWindow):
     """Main application window"""
     
+    SETTINGS_SAVE_DELAY_MS = 500
+    FILTER_DEBOUNCE_MS = 150
+    MAX_RX_IDS = 4096  # receive table keeps the most recently seen CAN IDs
+    EXPORT_BUFFER_SIZE = 256 * 1024  # log export write block, in bytes
+    IMPORT_CACHE_SIZE = 8  # parsed database files kept for re-imports
+    _PAUSED_BG = QBrush(QColor("#555"))  # shared by every paused cell
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("CANtroller - Intelligent CAN Bus Tool")
@@ -414,28 +751,47 @@ class MainWindow(QMainWindow):
         
         # CAN Manager
         self.can_manager = CANManager()
-        self.can_manager.message_received.connect(self._on_message_received)
-        self.can_manager.message_sent.connect(self._on_message_sent)
+        self.can_manager.messages_received.connect(self._on_messages_received)
+        self.can_manager.messages_sent.connect(self._on_messages_sent)
         self.can_manager.connection_changed.connect(self._on_connection_changed)
         self.can_manager.error_occurred.connect(self._on_error)
         self.can_manager.status_updated.connect(self._on_status_updated)
         
         # Message tracking
-        self.receive_messages: Dict[int, dict] = {}  # id -> {msg, count, first_time, last_time, timestamp}
-        self.transmit_count: Dict[int, int] = {}
+        # id -> receive state, least recently seen first (evicted past MAX_RX_IDS)
+        self.receive_messages: OrderedDict[int, _RxEntry] = OrderedDict()
+        # Receive table changes since the last repaint tick
+        self._rx_touched: set = set()
+        self._rx_new_ids: List[int] = []
+        self._rx_evicted: List[int] = []
+        # Every received CAN ID in ascending order, kept sorted on insert
+        self._rx_sorted_ids: List[int] = []
+        self.transmit_count: Dict[int, int] = defaultdict(int)  # id -> frames sent
+        # Sent CAN IDs whose rules-table counts are stale (see _update_cycle_times)
+        self._tx_touched: set = set()
+        self._rules_table_version = -1
+        # Periodic table rows as last drawn: [msg, count, is_paused] per row
+        self._periodic_shown: list = []
+        self._periodic_version = -1
+        # Per-row content last written by a full table update (None = redraw the row)
+        self._periodic_keys: list = []
+        self._rules_keys: list = []
         
         # Local counters for status bar
         self.local_rx_count = 0
         self.local_tx_count = 0
         
-        # Filter
+        # Filter, plus the forms _matches_filter compares against (see _set_filter)
         self.filter_text = ""
+        self._filter_id_text: Optional[str] = None
+        self._filter_name_text = ""
         
         # Display mode: 'hex', 'decimal', or 'decoded'
         self.display_mode = 'hex'
         
         # CAN ID Database (from CSV/MD import)
         self.id_database: Dict[int, str] = {}  # id -> name
+        self._name_lower: Dict[int, str] = {}  # id -> lower-cased name, for the filter
         
         # CAN Block Name -> ID mapping (for signal lookup by block name)
         self.name_to_id: Dict[str, int] = {}  # block_name -> id
@@ -443,9 +799,22 @@ class MainWindow(QMainWindow):
         # Signal database: CAN ID -> list of signal definitions
         # Each signal: {name, bit_start, bit_length, factor, unit}
         self.signal_database: Dict[int, List[dict]] = {}
+        # (CAN ID, frame length) -> (signal list, its length, compiled layout); see _signal_layout
+        self._signal_layouts: Dict[Tuple[int, int], tuple] = {}
         
         # Current config file
         self.current_file = None
+        # settings.json contents as last read/written, to skip redundant saves
+        self._settings_text = None
+        # Coalesces bursts of setting changes into one write
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(self.SETTINGS_SAVE_DELAY_MS)
+        self._settings_save_timer.timeout.connect(self._save_settings)
+        # Signal objects of file imports/exports (and profile generation) still running on the thread pool
+        self._file_task_signals: List[_FileTaskSignals] = []
+        # (parser, filename, mtime, size) -> parsed entries of recent imports
+        self._import_cache: Dict[tuple, list] = {}
         
         self._setup_ui()
         self._setup_menu()
@@ -457,6 +826,11 @@ class MainWindow(QMainWindow):
         self.update_timer.timeout.connect(self._update_cycle_times)
         self.update_timer.start(100)
         
+        # Receive table repaint tick (~30 Hz): applies everything received since the last tick
+        self.rx_flush_timer = QTimer()
+        self.rx_flush_timer.timeout.connect(self._flush_rx)
+        self.rx_flush_timer.start(33)
+        
         # Status update timer
         self.status_timer = QTimer()
         self.status_timer.timeout.connect(self._update_status_bar)
@@ -473,6 +847,8 @@ class MainWindow(QMainWindow):
         self.sim_engine.simulation_finished.connect(self._on_sim_finished)
         self.sim_engine.simulation_started.connect(self._on_sim_started)
         self.sim_engine.status_message.connect(self._on_sim_status)
+        # Bumped per Start/Stop click; a background generation only plays if no click came after it
+        self._sim_request = 0
     
     def _setup_ui(self):
         """Setup the main UI layout"""
@@ -496,6 +872,11 @@ class MainWindow(QMainWindow):
         self.filter_edit.setPlaceholderText("Enter CAN ID to filter (hex), e.g., 18F81280")
         self.filter_edit.textChanged.connect(self._on_filter_changed)
         filter_layout.addWidget(self.filter_edit)
+        # Re-filter once typing pauses rather than on every keystroke
+        self._filter_debounce = QTimer(self)
+        self._filter_debounce.setSingleShot(True)
+        self._filter_debounce.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_debounce.timeout.connect(self._apply_filter)
         
         self.filter_clear_btn = QPushButton("✖")
         self.filter_clear_btn.setMaximumWidth(30)
@@ -504,11 +885,14 @@ class MainWindow(QMainWindow):
         
         receive_layout.addLayout(filter_layout)
         
-        self.receive_table = QTableWidget()
-        self.receive_table.setColumnCount(8)
-        self.receive_table.setHorizontalHeaderLabels([
-            "Timestamp", "CAN-ID", "Name", "Type", "Length", "Data", "Cycle Time", "Count"
-        ])
+        self.receive_model = ReceiveModel(
+            self.receive_messages,
+            lambda msg_id: self.id_database.get(msg_id, ''),
+            self._format_receive_data,
+            self
+        )
+        self.receive_table = QTableView()
+        self.receive_table.setModel(self.receive_model)
         # Interactive mode with last column stretching
         header = self.receive_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
@@ -522,7 +906,7 @@ class MainWindow(QMainWindow):
         self.receive_table.setColumnWidth(5, 180)  # Data
         self.receive_table.setColumnWidth(6, 70)   # Cycle Time
         self.receive_table.setAlternatingRowColors(True)
-        self.receive_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.receive_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.receive_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.receive_table.customContextMenuRequested.connect(self._show_receive_context_menu)
         # Click on Data header to toggle HEX/Decimal
@@ -644,6 +1028,8 @@ class MainWindow(QMainWindow):
         self.rules_table.setColumnWidth(6, 55)   # Enabled
         self.rules_table.setAlternatingRowColors(True)
         self.rules_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.rules_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.rules_table.customContextMenuRequested.connect(self._show_rules_context_menu)
         self.rules_table.doubleClicked.connect(self._edit_rule)
         rules_layout.addWidget(self.rules_table)
         
@@ -759,107 +1145,70 @@ class MainWindow(QMainWindow):
         
         layout.addWidget(splitter)
     
+    def _mk_action(self, text: str, slot: Callable, shortcut: Optional[str] = None) -> QAction:
+        """Create a menu action connected to slot"""
+        action = QAction(text, self)
+        if shortcut:
+            action.setShortcut(shortcut)
+        action.triggered.connect(slot)
+        return action
+    
     def _setup_menu(self):
         """Setup menu bar"""
         menubar = self.menuBar()
+        mk = self._mk_action
         
         # File menu
         file_menu = menubar.addMenu("&File")
-        
-        new_action = QAction("&New", self)
-        new_action.setShortcut("Ctrl+N")
-        new_action.triggered.connect(self._new_config)
-        file_menu.addAction(new_action)
-        
-        open_action = QAction("&Open...", self)
-        open_action.setShortcut("Ctrl+O")
-        open_action.triggered.connect(self._open_config)
-        file_menu.addAction(open_action)
-        
-        save_action = QAction("&Save", self)
-        save_action.setShortcut("Ctrl+S")
-        save_action.triggered.connect(self._save_config)
-        file_menu.addAction(save_action)
-        
-        save_as_action = QAction("Save &As...", self)
-        save_as_action.setShortcut("Ctrl+Shift+S")
-        save_as_action.triggered.connect(self._save_config_as)
-        file_menu.addAction(save_as_action)
+        file_menu.addActions([
+            mk("&New", self._new_config, "Ctrl+N"),
+            mk("&Open...", self._open_config, "Ctrl+O"),
+            mk("&Save", self._save_config, "Ctrl+S"),
+            mk("Save &As...", self._save_config_as, "Ctrl+Shift+S"),
+        ])
         
         file_menu.addSeparator()
         
         # Export submenu
         export_menu = file_menu.addMenu("&Export")
-        
-        export_csv_action = QAction("Export Logs as &CSV...", self)
-        export_csv_action.triggered.connect(lambda: self._export_logs('csv'))
-        export_menu.addAction(export_csv_action)
-        
-        export_txt_action = QAction("Export Logs as &TXT...", self)
-        export_txt_action.triggered.connect(lambda: self._export_logs('txt'))
-        export_menu.addAction(export_txt_action)
-        
-        export_asc_action = QAction("Export Logs as &ASC...", self)
-        export_asc_action.triggered.connect(lambda: self._export_logs('asc'))
-        export_menu.addAction(export_asc_action)
+        export_menu.addActions([
+            mk("Export Logs as &CSV...", partial(self._export_logs, 'csv')),
+            mk("Export Logs as &TXT...", partial(self._export_logs, 'txt')),
+            mk("Export Logs as &ASC...", partial(self._export_logs, 'asc')),
+        ])
         
         # Import submenu
         import_menu = file_menu.addMenu("&Import")
-        
-        import_blocks_action = QAction("Import CAN &Blocks (CSV/MD)...", self)
-        import_blocks_action.triggered.connect(self._import_id_database)
-        import_menu.addAction(import_blocks_action)
-        
-        import_signals_action = QAction("Import &Signal Definitions (CSV/MD)...", self)
-        import_signals_action.triggered.connect(self._import_signal_database)
-        import_menu.addAction(import_signals_action)
+        import_menu.addActions([
+            mk("Import CAN &Blocks (CSV/MD)...", self._import_id_database),
+            mk("Import &Signal Definitions (CSV/MD)...", self._import_signal_database),
+        ])
         
         file_menu.addSeparator()
-        
-        exit_action = QAction("E&xit", self)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        file_menu.addAction(mk("E&xit", self.close))
         
         # CAN menu
         can_menu = menubar.addMenu("&CAN")
-        
-        connect_action = QAction("&Connect", self)
-        connect_action.triggered.connect(self._connect)
-        can_menu.addAction(connect_action)
-        
-        disconnect_action = QAction("&Disconnect", self)
-        disconnect_action.triggered.connect(self._disconnect)
-        can_menu.addAction(disconnect_action)
+        can_menu.addActions([
+            mk("&Connect", self._connect),
+            mk("&Disconnect", self._disconnect),
+        ])
         
         # Transmit menu
         transmit_menu = menubar.addMenu("&Transmit")
-        
-        new_msg_action = QAction("&New Message...", self)
-        new_msg_action.setShortcut("Ins")
-        new_msg_action.triggered.connect(self._new_transmit_message)
-        transmit_menu.addAction(new_msg_action)
+        transmit_menu.addAction(mk("&New Message...", self._new_transmit_message, "Ins"))
         
         # Simulation menu
         sim_menu = menubar.addMenu("&Simulation")
-        
-        sim_start_action = QAction("▶ &Start Simulation", self)
-        sim_start_action.triggered.connect(self._sim_start)
-        sim_menu.addAction(sim_start_action)
-        
-        sim_pause_action = QAction("⏸ &Pause Simulation", self)
-        sim_pause_action.triggered.connect(self._sim_pause)
-        sim_menu.addAction(sim_pause_action)
-        
-        sim_stop_action = QAction("⏹ S&top Simulation", self)
-        sim_stop_action.triggered.connect(self._sim_stop)
-        sim_menu.addAction(sim_stop_action)
+        sim_menu.addActions([
+            mk("▶ &Start Simulation", self._sim_start),
+            mk("⏸ &Pause Simulation", self._sim_pause),
+            mk("⏹ S&top Simulation", self._sim_stop),
+        ])
         
         # View menu
         view_menu = menubar.addMenu("&View")
-        
-        clear_action = QAction("&Clear Messages", self)
-        clear_action.triggered.connect(self._clear_messages)
-        view_menu.addAction(clear_action)
+        view_menu.addAction(mk("&Clear Messages", self._clear_messages))
     
     def _setup_toolbar(self):
         """Setup toolbar"""
@@ -870,15 +1219,22 @@ class MainWindow(QMainWindow):
         # Channel selector
         toolbar.addWidget(QLabel(" Channel: "))
         self.channel_combo = QComboBox()
-        self.channel_combo.addItems(CANManager.CHANNELS)
+        self._set_channel_items(CANManager.channels())
         toolbar.addWidget(self.channel_combo)
         
+        self.refresh_channels_btn = QPushButton("🔄")
+        self.refresh_channels_btn.setToolTip("Refresh channels")
+        self.refresh_channels_btn.clicked.connect(self._refresh_channels)
+        toolbar.addWidget(self.refresh_channels_btn)
+        
         toolbar.addSeparator()
         
         # Bitrate selector
         toolbar.addWidget(QLabel(" Bitrate: "))
         self.bitrate_combo = QComboBox()
         self.bitrate_combo.addItems(CANManager.BITRATES.keys())
+        # Bitrate text -> combo index (the list is fixed)
+        self._bitrate_index = {text: i for i, text in enumerate(CANManager.BITRATES)}
         toolbar.addWidget(self.bitrate_combo)
         
         toolbar.addSeparator()
@@ -968,6 +1324,29 @@ class MainWindow(QMainWindow):
         else:
             self._connect()
     
+    def _refresh_channels(self):
+        """Re-probe the attached adapters, keeping the current channel selected"""
+        current = self.channel_combo.currentText()
+        self._set_channel_items(CANManager.refresh_channels())
+        idx = self._channel_index.get(current, -1)
+        if idx >= 0:
+            self.channel_combo.setCurrentIndex(idx)
+    
+    def _set_channel_items(self, channels: List[str]):
+        """Fill the channel combo and its text -> index lookup"""
+        self.channel_combo.clear()
+        self.channel_combo.addItems(channels)
+        self._channel_index = {text: i for i, text in enumerate(channels)}
+    
+    def _apply_connection_settings(self, settings: dict):
+        """Select a config file's channel and bitrate in the toolbar combos"""
+        idx = self._channel_index.get(settings.get('channel', 'PCAN_USBBUS1'), -1)
+        if idx >= 0:
+            self.channel_combo.setCurrentIndex(idx)
+        idx = self._bitrate_index.get(settings.get('bitrate', '500 kbit/s'), -1)
+        if idx >= 0:
+            self.bitrate_combo.setCurrentIndex(idx)
+    
     def _connect(self):
         """Connect to CAN bus"""
         channel = self.channel_combo.currentText()
@@ -977,6 +1356,7 @@ class MainWindow(QMainWindow):
         if self.can_manager.connect(channel, bitrate):
             self.connect_btn.setText("🔌 Disconnect")
             self.channel_combo.setEnabled(False)
+            self.refresh_channels_btn.setEnabled(False)
             self.bitrate_combo.setEnabled(False)
             # Reset local counters
             self.local_rx_count = 0
@@ -989,6 +1369,7 @@ class MainWindow(QMainWindow):
         self.can_manager.disconnect()
         self.connect_btn.setText("🔌 Connect")
         self.channel_combo.setEnabled(True)
+        self.refresh_channels_btn.setEnabled(True)
         self.bitrate_combo.setEnabled(True)
     
     def _toggle_pause(self):
@@ -1002,18 +1383,42 @@ class MainWindow(QMainWindow):
     def _clear_messages(self):
         """Clear all received messages"""
         self.receive_messages.clear()
-        self.receive_table.setRowCount(0)
+        self._rx_sorted_ids.clear()
+        self._rx_touched.clear()
+        self._rx_new_ids.clear()
+        self._rx_evicted.clear()
+        self.receive_model.set_ids([])
+        self.receive_model.clear_labels()
+        self.receive_model.clear_data_text()
     
     def _on_filter_changed(self, text: str):
-        """Handle filter text change"""
+        """Handle filter text change (applied after FILTER_DEBOUNCE_MS without typing)"""
+        self._filter_debounce.start()
+    
+    def _apply_filter(self):
+        """Re-filter the receive table with the filter box contents"""
+        self._filter_debounce.stop()
+        previous = self.filter_text
+        self._set_filter(self.filter_edit.text())
+        if previous and previous in self.filter_text:
+            # A needle containing the old one only matches a subset of the rows
+            # already shown (typing narrows the list), so re-check just those
+            self._update_receive_table(self.receive_model.visible_ids())
+        else:
+            self._update_receive_table()
+    
+    def _set_filter(self, text: str):
+        """Store the filter and precompute what each CAN ID is matched against"""
         self.filter_text = text.strip().upper()
-        self._update_receive_table()
+        # Only an all-hex filter can occur in a formatted ID; otherwise skip formatting IDs
+        hex_only = self.filter_text.translate(_HEX_FILTER) == self.filter_text
+        self._filter_id_text = self.filter_text if hex_only else None
+        self._filter_name_text = self.filter_text.lower()
     
     def _clear_filter(self):
         """Clear the filter"""
         self.filter_edit.clear()
-        self.filter_text = ""
-        self._update_receive_table()
+        self._apply_filter()
     
     def _show_receive_context_menu(self, pos):
         """Show context menu for receive table"""
@@ -1033,13 +1438,14 @@ class MainWindow(QMainWindow):
     
     def _copy_receive_selection(self):
         """Copy selected receive message to clipboard"""
-        row = self.receive_table.currentRow()
+        row = self.receive_table.currentIndex().row()
         if row >= 0:
+            model = self.receive_model
             data = []
-            for col in range(self.receive_table.columnCount()):
-                item = self.receive_table.item(row, col)
-                if item:
-                    data.append(item.text())
+            for col in range(model.columnCount()):
+                text = model.data(model.index(row, col))
+                if text is not None:
+                    data.append(text)
             from PyQt6.QtWidgets import QApplication
             QApplication.clipboard().setText("\t".join(data))
     
@@ -1077,227 +1483,300 @@ class MainWindow(QMainWindow):
         
         menu.exec(self.periodic_table.mapToGlobal(pos))
     
-    def _on_message_received(self, msg: can.Message):
-        """Handle received CAN message"""
-        msg_id = msg.arbitration_id
-        current_time = time.time()
+    def _show_rules_context_menu(self, pos):
+        """Show context menu for response rules table"""
+        menu = QMenu(self)
         
-        # Increment local RX counter
-        self.local_rx_count += 1
+        add_action = QAction("Add Rule...", self)
+        add_action.triggered.connect(self._add_rule)
+        menu.addAction(add_action)
         
-        if msg_id in self.receive_messages:
-            entry = self.receive_messages[msg_id]
-            entry['count'] += 1
-            entry['last_time'] = current_time
-            entry['msg'] = msg
-        else:
-            self.receive_messages[msg_id] = {
-                'msg': msg,
-                'count': 1,
-                'first_time': current_time,
-                'last_time': current_time
-            }
+        edit_action = QAction("Edit Rule...", self)
+        edit_action.triggered.connect(self._edit_rule)
+        menu.addAction(edit_action)
         
-        self._update_receive_table()
-    
-    def _on_message_sent(self, msg: can.Message):
-        """Handle sent CAN message"""
-        msg_id = msg.arbitration_id
+        menu.addSeparator()
         
-        # Increment local TX counter
-        self.local_tx_count += 1
+        toggle_action = QAction("Toggle Enabled", self)
+        toggle_action.triggered.connect(self._toggle_rule_enabled)
+        menu.addAction(toggle_action)
         
-        if msg_id in self.transmit_count:
-            self.transmit_count[msg_id] += 1
-        else:
-            self.transmit_count[msg_id] = 1
-        self._update_periodic_table()
-        self._update_rules_table()
-    
-    def _update_receive_table(self):
-        """Update the receive messages table"""
-        # Filter messages
-        filtered_messages = {}
-        for msg_id, entry in self.receive_messages.items():
-            if self.filter_text:
-                id_hex = f"{msg_id:08X}" if entry['msg'].is_extended_id else f"{msg_id:03X}"
-                # Also search by name
-                name = self.id_database.get(msg_id, '')
-                if self.filter_text not in id_hex and self.filter_text.lower() not in name.lower():
-                    continue
-            filtered_messages[msg_id] = entry
+        menu.addSeparator()
         
-        self.receive_table.setRowCount(len(filtered_messages))
+        remove_action = QAction("Remove", self)
+        remove_action.triggered.connect(self._remove_rule)
+        menu.addAction(remove_action)
         
-        for row, (msg_id, entry) in enumerate(sorted(filtered_messages.items())):
-            msg = entry['msg']
-            
-            # Column 0: Timestamp
-            timestamp = datetime.fromtimestamp(entry['last_time']).strftime('%H:%M:%S.') + \
-                       f"{int((entry['last_time'] % 1) * 1000):03d}"
-            ts_item = QTableWidgetItem(timestamp)
-            ts_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.receive_table.setItem(row, 0, ts_item)
-            
-            # Column 1: CAN-ID
-            id_item = QTableWidgetItem(f"{msg_id:08X}h" if msg.is_extended_id else f"{msg_id:03X}h")
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.receive_table.setItem(row, 1, id_item)
-            
-            # Column 2: Name (from database)
-            name = self.id_database.get(msg_id, '')
-            name_item = QTableWidgetItem(name)
-            self.receive_table.setItem(row, 2, name_item)
-            
-            # Column 3: Type
-            type_text = "Ext" if msg.is_extended_id else "Std"
-            type_item = QTableWidgetItem(type_text)
-            type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.receive_table.setItem(row, 3, type_item)
-            
-            # Column 4: Length
-            length_item = QTableWidgetItem(str(len(msg.data)))
-            length_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.receive_table.setItem(row, 4, length_item)
-            
-            # Column 5: Data (HEX, Decimal, or Decoded based on display_mode)
-            if self.display_mode == 'decoded' and msg_id in self.signal_database:
-                data_str = self._decode_signals(msg_id, msg.data)
-            elif self.display_mode == 'decimal':
-                data_str = " ".join(str(b) for b in msg.data)
-            else:
-                data_str = " ".join(f"{b:02X}" for b in msg.data)
-            data_item = QTableWidgetItem(data_str)
-            self.receive_table.setItem(row, 5, data_item)
-            
-            # Column 6: Cycle Time (calculated from count and time span)
-            if entry['count'] > 1:
-                time_span = entry['last_time'] - entry['first_time']
-                if time_span > 0:
-                    cycle_time = (time_span / (entry['count'] - 1)) * 1000  # ms
-                    cycle_item = QTableWidgetItem(f"{cycle_time:.1f}")
-                else:
-                    cycle_item = QTableWidgetItem("-")
+        menu.exec(self.rules_table.mapToGlobal(pos))
+    
+    def _on_messages_received(self, msgs: List[can.Message]):
+        """Handle a burst of received CAN messages"""
+        current_time = time.time()
+        
+        # Increment local RX counter
+        self.local_rx_count += len(msgs)
+        
+        receive_messages = self.receive_messages
+        touched = self._rx_touched
+        sorted_ids = self._rx_sorted_ids
+        for msg in msgs:
+            msg_id = msg.arbitration_id
+            entry = receive_messages.get(msg_id)
+            if entry is not None:
+                entry.count += 1
+                entry.last_time = current_time
+                entry.msg = msg
+                receive_messages.move_to_end(msg_id)
+                touched.add(msg_id)
             else:
-                cycle_item = QTableWidgetItem("-")
-            cycle_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.receive_table.setItem(row, 6, cycle_item)
-            
-            # Column 7: Count
-            count_item = QTableWidgetItem(str(entry['count']))
-            count_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.receive_table.setItem(row, 7, count_item)
+                receive_messages[msg_id] = _RxEntry(msg, current_time)
+                self._rx_new_ids.append(msg_id)
+                bisect.insort(sorted_ids, msg_id)
+                if len(receive_messages) > self.MAX_RX_IDS:
+                    # Drop the CAN ID that has been silent the longest
+                    old_id, _ = receive_messages.popitem(last=False)
+                    del sorted_ids[bisect.bisect_left(sorted_ids, old_id)]
+                    touched.discard(old_id)
+                    self._rx_evicted.append(old_id)
+    
+    def _flush_rx(self):
+        """Repaint tick: push receive_messages changes since the last tick to the table"""
+        # While the table can't be seen, changes keep accumulating until it can
+        if self.isMinimized() or not self.receive_table.isVisible():
+            return
+        if self._rx_evicted:
+            self.receive_model.remove_ids(self._rx_evicted)
+            self._rx_evicted.clear()
+        if self._rx_new_ids:
+            # New IDs are inserted at their sorted rows; existing rows keep their place
+            receive_messages = self.receive_messages
+            self.receive_model.insert_ids([
+                msg_id for msg_id in self._rx_new_ids
+                if msg_id in receive_messages
+                and self._matches_filter(msg_id, receive_messages[msg_id])
+            ])
+            self._rx_new_ids.clear()
+        if self._rx_touched:
+            self.receive_model.refresh_ids(self._rx_touched)
+            self._rx_touched.clear()
+    
+    def _on_messages_sent(self, msgs: List[can.Message]):
+        """Handle a batch of sent CAN messages"""
+        # Increment local TX counter
+        self.local_tx_count += len(msgs)
+        
+        transmit_count = self.transmit_count
+        for msg in msgs:
+            msg_id = msg.arbitration_id
+            transmit_count[msg_id] += 1
+            self._tx_touched.add(msg_id)
+    
+    def _update_receive_table(self, candidates: Optional[List[int]] = None):
+        """Update the receive messages table, filtering candidates (sorted) or every received ID"""
+        # Filter messages; _rx_sorted_ids is already in display order
+        receive_messages = self.receive_messages
+        if candidates is None:
+            candidates = self._rx_sorted_ids
+        # Rows still shown can belong to IDs evicted since the last repaint tick
+        filtered_ids = [msg_id for msg_id in candidates
+                        if msg_id in receive_messages
+                        and self._matches_filter(msg_id, receive_messages[msg_id])]
+        
+        # Keep the selected message selected across a row-set change
+        current_id = self.receive_model.msg_id_at(self.receive_table.currentIndex().row())
+        self.receive_model.set_ids(filtered_ids)
+        if current_id is not None and not self.receive_table.currentIndex().isValid():
+            row = self.receive_model.row_of(current_id)
+            if row >= 0:
+                self.receive_table.selectRow(row)
+    
+    def _matches_filter(self, msg_id: int, entry: _RxEntry) -> bool:
+        """Whether a received CAN ID passes the filter (ID hex or database name)"""
+        if not self.filter_text:
+            return True
+        id_text = self._filter_id_text
+        # The cached column text only adds a lowercase 'h', which a hex filter never matches
+        if id_text is not None and id_text in self.receive_model.id_text(msg_id, entry.msg):
+            return True
+        # Also search by name
+        name = self._name_lower.get(msg_id)
+        return name is not None and self._filter_name_text in name
+    
+    def _format_receive_data(self, msg_id: int, msg: can.Message) -> str:
+        """Format the Data column (HEX, Decimal, or Decoded based on display_mode)"""
+        if self.display_mode == 'decoded' and msg_id in self.signal_database:
+            return self._decode_signals(msg_id, msg.data)
+        elif self.display_mode == 'decimal':
+            return " ".join(map(str, msg.data))
+        return msg.data.hex(' ').upper()
+    
+    @staticmethod
+    def _set_cell(table: QTableWidget, row: int, col: int, text: str,
+                  centered: bool = False, background: Optional[QBrush] = None):
+        """Set a cell's text, reusing its QTableWidgetItem when one exists"""
+        item = table.item(row, col)
+        if item is None:
+            item = QTableWidgetItem(text)
+            if centered:
+                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+            table.setItem(row, col, item)
+        elif item.text() != text:
+            item.setText(text)
+        item.setData(Qt.ItemDataRole.BackgroundRole, background)
+    
+    @staticmethod
+    @contextmanager
+    def _bulk_update(table: QTableWidget):
+        """Suspend repaints (and sorting, if enabled) while a table is refilled"""
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        try:
+            yield table
+        finally:
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting)
     
     def _update_periodic_table(self):
         """Update the periodic messages table"""
         messages = self.can_manager.get_transmit_messages()
-        self.periodic_table.setRowCount(len(messages))
-        
-        for row, msg in enumerate(messages):
-            # CAN-ID
-            id_item = QTableWidgetItem(f"{msg.msg_id:08X}h" if msg.is_extended else f"{msg.msg_id:03X}h")
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            # Color based on pause state
-            if msg.is_paused:
-                id_item.setBackground(QColor("#555"))
-            self.periodic_table.setItem(row, 0, id_item)
-            
-            # Type
-            type_text = "Ext" if msg.is_extended else "Std"
-            type_item = QTableWidgetItem(type_text)
-            type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if msg.is_paused:
-                type_item.setBackground(QColor("#555"))
-            self.periodic_table.setItem(row, 1, type_item)
-            
-            # Length
-            length_item = QTableWidgetItem(str(len(msg.data)))
-            length_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if msg.is_paused:
-                length_item.setBackground(QColor("#555"))
-            self.periodic_table.setItem(row, 2, length_item)
-            
-            # Data
-            data_str = " ".join(f"{b:02X}" for b in msg.data)
-            data_item = QTableWidgetItem(data_str)
-            if msg.is_paused:
-                data_item.setBackground(QColor("#555"))
-            self.periodic_table.setItem(row, 3, data_item)
-            
-            # Cycle Time
-            cycle_text = f"{msg.cycle_time_ms} ms" if msg.cycle_time_ms > 0 else "Manual"
-            if msg.is_paused:
-                cycle_text = f"⏸ {cycle_text}"
-            cycle_item = QTableWidgetItem(cycle_text)
-            cycle_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if msg.is_paused:
-                cycle_item.setBackground(QColor("#555"))
-            self.periodic_table.setItem(row, 4, cycle_item)
+        table = self.periodic_table
+        set_cell = self._set_cell
+        keys = self._periodic_keys
+        del keys[len(messages):]
+        keys.extend([None] * (len(messages) - len(keys)))
+        with self._bulk_update(table):
+            table.setRowCount(len(messages))
+            self._periodic_version = self.can_manager.transmit_version
+            self._periodic_shown = [[msg, msg.count, msg.is_paused] for msg in messages]
             
-            # Count
-            count_item = QTableWidgetItem(str(msg.count))
-            count_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if msg.is_paused:
-                count_item.setBackground(QColor("#555"))
-            self.periodic_table.setItem(row, 5, count_item)
-            
-            # Comment
-            comment_item = QTableWidgetItem(msg.comment)
-            if msg.is_paused:
-                comment_item.setBackground(QColor("#555"))
-            self.periodic_table.setItem(row, 6, comment_item)
+            for row, msg in enumerate(messages):
+                # Skip rows already showing this content
+                key = (msg.msg_id, msg.is_extended, bytes(msg.data), msg.cycle_time_ms,
+                       msg.is_paused, msg.count, msg.comment)
+                if keys[row] == key:
+                    continue
+                keys[row] = key
+                
+                # Color based on pause state
+                bg = self._PAUSED_BG if msg.is_paused else None
+                
+                # CAN-ID
+                set_cell(table, row, 0, f"{msg.msg_id:08X}h" if msg.is_extended else f"{msg.msg_id:03X}h", True, bg)
+                
+                # Type
+                set_cell(table, row, 1, "Ext" if msg.is_extended else "Std", True, bg)
+                
+                # Length
+                set_cell(table, row, 2, str(len(msg.data)), True, bg)
+                
+                # Data
+                set_cell(table, row, 3, msg.data.hex(' ').upper(), False, bg)
+                
+                # Cycle Time
+                cycle_text = f"{msg.cycle_time_ms} ms" if msg.cycle_time_ms > 0 else "Manual"
+                if msg.is_paused:
+                    cycle_text = f"⏸ {cycle_text}"
+                set_cell(table, row, 4, cycle_text, True, bg)
+                
+                # Count
+                set_cell(table, row, 5, str(msg.count), True, bg)
+                
+                # Comment
+                set_cell(table, row, 6, msg.comment, False, bg)
     
     def _update_rules_table(self):
         """Update the response rules table"""
         rules = self.can_manager.get_response_rules()
-        self.rules_table.setRowCount(len(rules))
-        
-        for row, rule in enumerate(rules):
-            # Trigger ID
-            trigger_item = QTableWidgetItem(f"{rule.trigger_id:08X}h")
-            trigger_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.rules_table.setItem(row, 0, trigger_item)
-            
-            # Response ID
-            response_item = QTableWidgetItem(f"{rule.response_id:08X}h")
-            response_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.rules_table.setItem(row, 1, response_item)
+        table = self.rules_table
+        set_cell = self._set_cell
+        transmit_count = self.transmit_count
+        keys = self._rules_keys
+        del keys[len(rules):]
+        keys.extend([None] * (len(rules) - len(keys)))
+        with self._bulk_update(table):
+            table.setRowCount(len(rules))
+            self._rules_table_version = self.can_manager.rules_version
             
-            # Length
-            length_item = QTableWidgetItem(str(len(rule.response_data)))
-            length_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.rules_table.setItem(row, 2, length_item)
-            
-            # Data
-            data_str = " ".join(f"{b:02X}" for b in rule.response_data)
-            data_item = QTableWidgetItem(data_str)
-            self.rules_table.setItem(row, 3, data_item)
-            
-            # Delay
-            delay_item = QTableWidgetItem(f"{rule.delay_ms} ms")
-            delay_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.rules_table.setItem(row, 4, delay_item)
-            
-            # Count
-            count = self.transmit_count.get(rule.response_id, 0)
-            count_item = QTableWidgetItem(str(count))
-            count_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.rules_table.setItem(row, 5, count_item)
-            
-            # Enabled
-            enabled_item = QTableWidgetItem("✓" if rule.enabled else "✗")
-            enabled_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.rules_table.setItem(row, 6, enabled_item)
-            
-            # Comment
-            comment_item = QTableWidgetItem(rule.comment)
-            self.rules_table.setItem(row, 7, comment_item)
+            for row, rule in enumerate(rules):
+                # Skip rows already showing this content
+                count = transmit_count.get(rule.response_id, 0)
+                key = (rule.trigger_id, rule.response_id, bytes(rule.response_data),
+                       rule.delay_ms, count, rule.enabled, rule.comment)
+                if keys[row] == key:
+                    continue
+                keys[row] = key
+                
+                # Trigger ID
+                set_cell(table, row, 0, f"{rule.trigger_id:08X}h", True)
+                
+                # Response ID
+                set_cell(table, row, 1, f"{rule.response_id:08X}h", True)
+                
+                # Length
+                set_cell(table, row, 2, str(len(rule.response_data)), True)
+                
+                # Data
+                set_cell(table, row, 3, rule.response_data.hex(' ').upper())
+                
+                # Delay
+                set_cell(table, row, 4, f"{rule.delay_ms} ms", True)
+                
+                # Count
+                set_cell(table, row, 5, str(count), True)
+                
+                # Enabled
+                set_cell(table, row, 6, "✓" if rule.enabled else "✗", True)
+                
+                # Comment
+                set_cell(table, row, 7, rule.comment)
     
     def _update_cycle_times(self):
         """Periodic update for cycle times display"""
-        if self.can_manager.is_connected and not self.can_manager.paused:
-            self._update_receive_table()
+        # Receive rows are repainted by _flush_rx as frames arrive. Tables on a
+        # hidden tab are skipped; their stale rows are caught up once shown
+        if self.isMinimized():
+            return
+        if self.can_manager.is_connected and self.periodic_table.isVisible():
+            self._refresh_periodic_counts()
+        if self._tx_touched and self.rules_table.isVisible():
+            self._refresh_rule_counts()
+    
+    def _refresh_rule_counts(self):
+        """Update the Count cells of rules whose response ID was sent since the last tick"""
+        touched = self._tx_touched
+        if self._rules_table_version != self.can_manager.rules_version:
+            self._update_rules_table()
+        else:
+            table = self.rules_table
+            transmit_count = self.transmit_count
+            keys = self._rules_keys
+            for row, rule in enumerate(self.can_manager.get_response_rules()):
+                if rule.response_id in touched:
+                    table.item(row, 5).setText(str(transmit_count[rule.response_id]))
+                    keys[row] = None
+        touched.clear()
+    
+    def _refresh_periodic_counts(self):
+        """Update Count/Data cells of periodic rows that sent since the last tick"""
+        shown = self._periodic_shown
+        if (self._periodic_version != self.can_manager.transmit_version
+                or any(entry[2] != entry[0].is_paused for entry in shown)):
             self._update_periodic_table()
+            return
+        
+        table = self.periodic_table
+        keys = self._periodic_keys
+        for row, entry in enumerate(shown):
+            msg = entry[0]
+            count = msg.count
+            if count == entry[1]:
+                continue
+            entry[1] = count
+            keys[row] = None
+            table.item(row, 5).setText(str(count))
+            if msg.increment_byte >= 0:
+                table.item(row, 3).setText(msg.data.hex(' ').upper())
     
     # === Periodic Messages ===
     
@@ -1369,6 +1848,14 @@ class MainWindow(QMainWindow):
             self.can_manager.remove_response_rule(row)
             self._update_rules_table()
     
+    def _toggle_rule_enabled(self):
+        """Enable/disable selected response rule"""
+        row = self.rules_table.currentRow()
+        rules = self.can_manager.get_response_rules()
+        if 0 <= row < len(rules):
+            self.can_manager.set_rule_enabled(row, not rules[row].enabled)
+            self._update_rules_table()
+    
     def _toggle_response_mode(self):
         """Toggle automatic response mode"""
         enabled = self.response_mode_btn.isChecked()
@@ -1412,6 +1899,9 @@ class MainWindow(QMainWindow):
         """Handle window close"""
         if self.can_manager.is_connected:
             self.can_manager.disconnect()
+        if self._settings_save_timer.isActive():
+            self._settings_save_timer.stop()
+            self._save_settings()
         event.accept()
     
     # === Save/Load Configuration ===
@@ -1486,17 +1976,7 @@ class MainWindow(QMainWindow):
                 
                 # Load connection settings if present
                 if 'settings' in config:
-                    settings = config['settings']
-                    channel = settings.get('channel', 'PCAN_USBBUS1')
-                    bitrate = settings.get('bitrate', '500 kbit/s')
-                    
-                    # Set combo boxes
-                    idx = self.channel_combo.findText(channel)
-                    if idx >= 0:
-                        self.channel_combo.setCurrentIndex(idx)
-                    idx = self.bitrate_combo.findText(bitrate)
-                    if idx >= 0:
-                        self.bitrate_combo.setCurrentIndex(idx)
+                    self._apply_connection_settings(config['settings'])
                 
                 self.current_file = filename
                 self._update_window_title()
@@ -1546,7 +2026,7 @@ class MainWindow(QMainWindow):
             for msg in self.can_manager.get_transmit_messages():
                 config['periodic_messages'].append({
                     'msg_id': msg.msg_id,
-                    'data': msg.data,
+                    'data': list(msg.data),
                     'is_extended': msg.is_extended,
                     'cycle_time_ms': msg.cycle_time_ms,
                     'increment_byte': msg.increment_byte,
@@ -1559,7 +2039,7 @@ class MainWindow(QMainWindow):
                 config['response_rules'].append({
                     'trigger_id': rule.trigger_id,
                     'response_id': rule.response_id,
-                    'response_data': rule.response_data,
+                    'response_data': list(rule.response_data),
                     'increment_byte': rule.increment_byte,
                     'is_extended': rule.is_extended,
                     'delay_ms': rule.delay_ms,
@@ -1567,12 +2047,13 @@ class MainWindow(QMainWindow):
                     'enabled': rule.enabled
                 })
             
+            text = dumps_config(config)
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+                f.write(text)
             
             self.current_file = filename
             self._update_window_title()
-            self._save_settings()  # Save last file path
+            self._request_save()  # Save last file path
             
             QMessageBox.information(self, "Success", f"Configuration saved to:\n{filename}")
             
@@ -1584,20 +2065,22 @@ class MainWindow(QMainWindow):
     def _load_settings(self):
         """Load application settings from file"""
         try:
-            if os.path.exists(SETTINGS_FILE):
-                with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
+            if SETTINGS_FILE.exists():
+                text = SETTINGS_FILE.read_text(encoding='utf-8')
+                settings = json.loads(text)
+                self._settings_text = text
                 
                 # Restore display mode
                 self.display_mode = settings.get('display_mode', 'hex')
                 
                 # Restore ID database
-                id_db = settings.get('id_database', {})
-                self.id_database = {int(k): v for k, v in id_db.items()}
+                self.id_database = _int_keyed(settings.get('id_database', {}))
+                self._name_lower = {k: v.lower() for k, v in self.id_database.items() if v}
+                self.receive_model.clear_labels()
                 
                 # Restore signal database
-                sig_db = settings.get('signal_database', {})
-                self.signal_database = {int(k): v for k, v in sig_db.items()}
+                self.signal_database = _int_keyed(settings.get('signal_database', {}))
+                self.receive_model.clear_data_text()
                 
                 # Restore name_to_id mapping
                 self.name_to_id = settings.get('name_to_id', {})
@@ -1609,18 +2092,28 @@ class MainWindow(QMainWindow):
         except Exception:
             pass  # Ignore errors, use defaults
     
+    def _request_save(self):
+        """Schedule a settings save; changes within SETTINGS_SAVE_DELAY_MS share one write"""
+        self._settings_save_timer.start()
+    
     def _save_settings(self):
         """Save application settings to file"""
         try:
             settings = {
                 'last_file': self.current_file,
                 'display_mode': self.display_mode,
-                'id_database': {str(k): v for k, v in self.id_database.items()},
-                'signal_database': {str(k): v for k, v in self.signal_database.items()},
+                # [id, value] pairs keep the int keys JSON objects cannot hold
+                'id_database': list(self.id_database.items()),
+                'signal_database': list(self.signal_database.items()),
                 'name_to_id': self.name_to_id
             }
-            with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2)
+            # Compact, serialized in one C-accelerated call and written only
+            # when it differs from what is already on disk
+            text = json.dumps(settings, separators=(',', ':'))
+            if text == self._settings_text:
+                return
+            SETTINGS_FILE.write_text(text, encoding='utf-8')
+            self._settings_text = text
         except Exception:
             pass  # Ignore errors
     
@@ -1663,22 +2156,13 @@ class MainWindow(QMainWindow):
             
             # Load connection settings if present
             if 'settings' in config:
-                settings = config['settings']
-                channel = settings.get('channel', 'PCAN_USBBUS1')
-                bitrate = settings.get('bitrate', '500 kbit/s')
-                
-                idx = self.channel_combo.findText(channel)
-                if idx >= 0:
-                    self.channel_combo.setCurrentIndex(idx)
-                idx = self.bitrate_combo.findText(bitrate)
-                if idx >= 0:
-                    self.bitrate_combo.setCurrentIndex(idx)
+                self._apply_connection_settings(config['settings'])
             
             self.current_file = filename
             self._update_window_title()
             self._update_periodic_table()
             self._update_rules_table()
-            self._save_settings()
+            self._request_save()
             return True
         except Exception:
             return False
@@ -1687,18 +2171,17 @@ class MainWindow(QMainWindow):
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter for .cantroller files"""
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                if url.toLocalFile().endswith('.cantroller') or url.toLocalFile().endswith('.json'):
-                    event.acceptProposedAction()
-                    return
+        mime = event.mimeData()
+        if mime.hasUrls() and any(url.toLocalFile().endswith(_SUPPORTED_EXTS) for url in mime.urls()):
+            event.acceptProposedAction()
+            return
         event.ignore()
     
     def dropEvent(self, event: QDropEvent):
         """Handle drop for .cantroller files"""
         for url in event.mimeData().urls():
             filepath = url.toLocalFile()
-            if filepath.endswith('.cantroller') or filepath.endswith('.json'):
+            if filepath.endswith(_SUPPORTED_EXTS):
                 if self._load_config_file(filepath):
                     QMessageBox.information(self, "Success", f"Configuration loaded from:\n{filepath}")
                 else:
@@ -1724,42 +2207,59 @@ class MainWindow(QMainWindow):
         if not filename:
             return
         
-        try:
-            with open(filename, 'w', encoding='utf-8', newline='') as f:
-                if format_type == 'csv':
-                    writer = csv.writer(f)
-                    writer.writerow(['Timestamp', 'CAN-ID', 'Name', 'Type', 'Length', 'Data', 'Count'])
-                    for msg_id, entry in sorted(self.receive_messages.items()):
-                        msg = entry['msg']
-                        id_hex = f"{msg_id:08X}" if msg.is_extended_id else f"{msg_id:03X}"
-                        name = self.id_database.get(msg_id, '')
-                        data_str = ' '.join(f"{b:02X}" for b in msg.data)
-                        timestamp = datetime.fromtimestamp(entry['last_time']).strftime('%H:%M:%S.%f')[:-3]
-                        writer.writerow([timestamp, id_hex, name, 'Ext' if msg.is_extended_id else 'Std', 
-                                        len(msg.data), data_str, entry['count']])
-                
-                elif format_type == 'txt':
-                    for msg_id, entry in sorted(self.receive_messages.items()):
-                        msg = entry['msg']
-                        id_hex = f"{msg_id:08X}" if msg.is_extended_id else f"{msg_id:03X}"
-                        data_str = ' '.join(f"{b:02X}" for b in msg.data)
-                        timestamp = datetime.fromtimestamp(entry['last_time']).strftime('%H:%M:%S.%f')[:-3]
-                        f.write(f"{timestamp}  {id_hex}  [{len(msg.data)}]  {data_str}\n")
-                
-                elif format_type == 'asc':
-                    f.write("date " + datetime.now().strftime("%a %b %d %I:%M:%S %p %Y") + "\n")
-                    f.write("base hex  timestamps absolute\n")
-                    f.write("Begin Triggerblock\n")
-                    for msg_id, entry in sorted(self.receive_messages.items()):
-                        msg = entry['msg']
-                        data_str = ' '.join(f"{b:02X}" for b in msg.data)
-                        timestamp = entry['last_time']
-                        f.write(f"   {timestamp:.6f} 1  {msg_id:08X}x       Rx   d {len(msg.data)}  {data_str}\n")
-                    f.write("End Triggerblock\n")
+        # Snapshot on the GUI thread (receive entries keep changing), in ID order
+        receive_messages = self.receive_messages
+        id_database = self.id_database
+        rows = []
+        for msg_id in self._rx_sorted_ids:
+            entry = receive_messages[msg_id]
+            rows.append((msg_id, entry.msg, entry.last_time, entry.count, id_database.get(msg_id, '')))
+        
+        self._start_file_task(
+            partial(self._write_log, format_type, rows), filename,
+            lambda filename, _: QMessageBox.information(self, "Export", f"Logs exported to:\n{filename}"),
+            "Failed to export logs")
+    
+    @classmethod
+    def _write_log(cls, format_type: str, rows: list, filename: str):
+        """Write an export snapshot of (id, frame, last_time, count, name) rows (worker thread)"""
+        def clock(t: float) -> str:
+            # Rounded to microseconds before the milliseconds are cut, unlike the table
+            return datetime.fromtimestamp(t).strftime('%H:%M:%S.%f')[:-3]
+        
+        # Rows are streamed into a large write buffer, so the file is written in
+        # EXPORT_BUFFER_SIZE blocks
+        with open(filename, 'w', encoding='utf-8', newline='', buffering=cls.EXPORT_BUFFER_SIZE) as f:
+            if format_type == 'csv':
+                writer = csv.writer(f)
+                writer.writerow(['Timestamp', 'CAN-ID', 'Name', 'Type', 'Length', 'Data', 'Count'])
+                writer.writerows(
+                    (clock(last_time),
+                     f"{msg_id:08X}" if msg.is_extended_id else f"{msg_id:03X}",
+                     name,
+                     'Ext' if msg.is_extended_id else 'Std',
+                     len(msg.data), msg.data.hex(' ').upper(), count)
+                    for msg_id, msg, last_time, count, name in rows
+                )
             
-            QMessageBox.information(self, "Export", f"Logs exported to:\n{filename}")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to export logs:\n{str(e)}")
+            elif format_type == 'txt':
+                f.writelines(
+                    f"{clock(last_time)}  "
+                    f"{f'{msg_id:08X}' if msg.is_extended_id else f'{msg_id:03X}'}  "
+                    f"[{len(msg.data)}]  {msg.data.hex(' ').upper()}\n"
+                    for msg_id, msg, last_time, count, name in rows
+                )
+            
+            elif format_type == 'asc':
+                f.write("date " + datetime.now().strftime("%a %b %d %I:%M:%S %p %Y") + "\n")
+                f.write("base hex  timestamps absolute\n")
+                f.write("Begin Triggerblock\n")
+                f.writelines(
+                    f"   {last_time:.6f} 1  {msg_id:08X}x       Rx   d {len(msg.data)}  "
+                    f"{msg.data.hex(' ').upper()}\n"
+                    for msg_id, msg, last_time, count, name in rows
+                )
+                f.write("End Triggerblock\n")
     
     # === Import CSV Database ===
     
@@ -1775,22 +2275,61 @@ class MainWindow(QMainWindow):
         if not filename:
             return
         
+        parse = self._import_md_blocks if filename.endswith('.md') else self._import_csv_blocks
+        self._start_import(parse, filename, self._on_id_database_parsed, "Failed to import database")
+    
+    def _start_import(self, parse: Callable[[str], list], filename: str,
+                      on_finished: Callable[[str, object], None], error_text: str):
+        """Parse a database file on the thread pool, reusing the result for an unchanged file"""
         try:
-            count = 0
-            if filename.endswith('.md'):
-                count = self._import_md_blocks(filename)
-            else:
-                count = self._import_csv_blocks(filename)
-            
-            self._save_settings()
-            self._update_receive_table()
-            QMessageBox.information(self, "Import", f"Imported {count} CAN ID entries from:\n{filename}")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to import database:\n{str(e)}")
+            st = os.stat(filename)
+            key = (parse, filename, st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None  # the worker reports the error
+        cache = self._import_cache
+        if key in cache:
+            on_finished(filename, cache[key])
+            return
+        
+        def finished(filename: str, entries: list):
+            if key is not None:
+                cache[key] = entries
+                if len(cache) > self.IMPORT_CACHE_SIZE:
+                    del cache[next(iter(cache))]  # oldest parse
+            on_finished(filename, entries)
+        
+        self._start_file_task(parse, filename, finished, error_text)
+    
+    def _start_file_task(self, task: Callable[[str], object], filename: str,
+                         on_finished: Callable[[str, object], None], error_text: str):
+        """Read or write a file on the thread pool; results arrive on the GUI thread"""
+        worker = _FileTask(task, filename)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.failed.connect(
+            lambda _filename, error: QMessageBox.warning(self, "Error", f"{error_text}:\n{error}"))
+        # Keep the signal object alive until the queued results are delivered
+        pending = self._file_task_signals
+        pending.append(worker.signals)
+        worker.signals.finished.connect(lambda *_: pending.remove(worker.signals))
+        worker.signals.failed.connect(lambda *_: pending.remove(worker.signals))
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_id_database_parsed(self, filename: str, entries: List[Tuple[int, str]]):
+        """Merge parsed CAN ID names (GUI thread)"""
+        # One bulk update per dict; later rows win, as with per-row assignment
+        self.id_database.update(entries)
+        self._name_lower.update([(msg_id, name.lower()) for msg_id, name in entries])
+        self.name_to_id.update([(name.upper(), msg_id) for msg_id, name in entries])
+        
+        self._request_save()
+        self.receive_model.clear_labels()
+        self._update_receive_table()
+        QMessageBox.information(self, "Import", f"Imported {len(entries)} CAN ID entries from:\n{filename}")
     
-    def _import_csv_blocks(self, filename: str) -> int:
-        """Import CAN IDs from CSV file (CAN bus Nr,Name,CAN ID [hex],...)"""
-        count = 0
+    @staticmethod
+    def _import_csv_blocks(filename: str) -> List[Tuple[int, str]]:
+        """Read CAN IDs from CSV file (CAN bus Nr,Name,CAN ID [hex],...)"""
+        entries = []
         with open(filename, 'r', encoding='utf-8-sig', errors='replace') as f:
             reader = csv.reader(f)
             header = next(reader, None)  # Skip header
@@ -1801,44 +2340,38 @@ class MainWindow(QMainWindow):
                 try:
                     # Format: CAN bus Nr, Name, CAN ID [hex], ...
                     name = row[1].strip()
-                    can_id_str = row[2].strip().replace('0x', '').replace('h', '')
-                    msg_id = int(can_id_str, 16)
+                    msg_id = parse_hex_id(row[2])
                     
                     if msg_id and name:
-                        self.id_database[msg_id] = name
-                        self.name_to_id[name.upper()] = msg_id
-                        count += 1
+                        entries.append((msg_id, name))
                 except (ValueError, IndexError):
                     continue
-        return count
+        return entries
     
-    def _import_md_blocks(self, filename: str) -> int:
-        """Import CAN IDs from Notion-exported Markdown table"""
-        count = 0
+    @staticmethod
+    def _import_md_blocks(filename: str) -> List[Tuple[int, str]]:
+        """Read CAN IDs from Notion-exported Markdown table"""
+        entries = []
         with open(filename, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        for line in lines:
-            line = line.strip()
-            if not line.startswith('|') or '---' in line:
-                continue
-            
-            parts = [p.strip() for p in line.split('|')[1:-1]]
-            if len(parts) < 3 or 'CAN ID' in parts[2] or 'Name' in parts[1]:
-                continue
-            
-            try:
-                name = parts[1].strip().replace('**', '')
-                can_id_str = parts[2].strip().replace('0x', '').replace('**', '')
-                msg_id = int(can_id_str, 16)
+            # Iterate the file lazily; it is never held in memory as a list of lines
+            for line in f:
+                line = line.strip()
+                if not line.startswith('|') or '---' in line:
+                    continue
                 
-                if msg_id and name:
-                    self.id_database[msg_id] = name
-                    self.name_to_id[name.upper()] = msg_id
-                    count += 1
-            except (ValueError, IndexError):
-                continue
-        return count
+                parts = [p.strip() for p in line.split('|')[1:-1]]
+                if len(parts) < 3 or 'CAN ID' in parts[2] or 'Name' in parts[1]:
+                    continue
+                
+                try:
+                    name = parts[1].replace('**', '')
+                    msg_id = parse_hex_id(parts[2].replace('**', ''))
+                    
+                    if msg_id and name:
+                        entries.append((msg_id, name))
+                except (ValueError, IndexError):
+                    continue
+        return entries
     
     def _import_signal_database(self):
         """Import signal definitions from CSV or MD file"""
@@ -1852,20 +2385,30 @@ class MainWindow(QMainWindow):
         if not filename:
             return
         
-        try:
-            count = self._import_md_signals(filename) if filename.endswith('.md') else self._import_csv_signals(filename)
-            self._save_settings()
-            # Show which CAN IDs have signals defined
-            can_ids = [f"0x{cid:08X}" for cid in self.signal_database.keys()]
-            ids_str = ", ".join(can_ids[:5]) + ("..." if len(can_ids) > 5 else "")
-            QMessageBox.information(self, "Import", 
-                f"Imported {count} signal definitions from:\n{filename}\n\nCAN IDs with signals: {ids_str}")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to import signals:\n{str(e)}")
-    
-    def _import_csv_signals(self, filename: str) -> int:
-        """Import signals from CSV (CAN ID,CAN Data Point,Signal name,Bit start,Bit length,Factor,Unit)"""
-        count = 0
+        parse = self._import_md_signals if filename.endswith('.md') else self._import_csv_signals
+        self._start_import(parse, filename, self._on_signal_database_parsed, "Failed to import signals")
+    
+    def _on_signal_database_parsed(self, filename: str, entries: List[Tuple[int, dict]]):
+        """Merge parsed signal definitions (GUI thread)"""
+        signal_database = self.signal_database
+        for msg_id, signal in entries:
+            signals = signal_database.get(msg_id)
+            if signals is None:
+                signals = signal_database[msg_id] = []
+            signals.append(signal)
+        
+        self._request_save()
+        self.receive_model.clear_data_text()
+        # Show which CAN IDs have signals defined
+        can_ids = [f"0x{cid:08X}" for cid in self.signal_database.keys()]
+        ids_str = ", ".join(can_ids[:5]) + ("..." if len(can_ids) > 5 else "")
+        QMessageBox.information(self, "Import", 
+            f"Imported {len(entries)} signal definitions from:\n{filename}\n\nCAN IDs with signals: {ids_str}")
+    
+    @staticmethod
+    def _import_csv_signals(filename: str) -> List[Tuple[int, dict]]:
+        """Read signals from CSV (CAN ID,CAN Data Point,Signal name,Bit start,Bit length,Factor,Unit)"""
+        entries = []
         with open(filename, 'r', encoding='utf-8-sig', errors='replace') as f:
             reader = csv.reader(f)
             next(reader, None)  # Skip header
@@ -1879,7 +2422,7 @@ class MainWindow(QMainWindow):
                     if data_point.lower().startswith('undef') or not data_point:
                         continue
                     
-                    msg_id = int(row[0].strip().replace('0x', ''), 16)
+                    msg_id = parse_hex_id(row[0])
                     signal_name = row[2].strip() if len(row) > 2 else data_point
                     
                     # Parse factor - handle non-numeric values like '—'
@@ -1898,105 +2441,84 @@ class MainWindow(QMainWindow):
                         'unit': row[6].strip() if len(row) > 6 and row[6] != '—' else ''
                     }
                     
-                    if msg_id not in self.signal_database:
-                        self.signal_database[msg_id] = []
-                    self.signal_database[msg_id].append(signal)
-                    count += 1
+                    entries.append((msg_id, signal))
                 except (ValueError, IndexError):
                     continue
-        return count
+        return entries
     
-    def _import_md_signals(self, filename: str) -> int:
-        """Import signals from Notion-exported Markdown table"""
-        count = 0
+    @staticmethod
+    def _import_md_signals(filename: str) -> List[Tuple[int, dict]]:
+        """Read signals from Notion-exported Markdown table"""
+        entries = []
         current_can_id = None
         
         with open(filename, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Look for CAN ID in headers like "### GET_SOC_1 (0x18F81280)"
-            if line.startswith('###') and '(0x' in line:
-                try:
-                    hex_start = line.find('(0x') + 3
-                    hex_end = line.find(')', hex_start)
-                    if hex_end > hex_start:
-                        current_can_id = int(line[hex_start:hex_end], 16)
-                except ValueError:
-                    current_can_id = None
-                continue
-            
-            if not line.startswith('|') or '---' in line or current_can_id is None:
-                continue
-            
-            parts = [p.strip().replace('**', '') for p in line.split('|')[1:-1]]
-            if len(parts) < 4:
-                continue
-            
-            # Skip header rows
-            if 'Signal' in parts[0] or 'Variable' in parts[0] or 'name' in parts[0].lower():
-                continue
-            
-            try:
-                name = parts[0].strip()
-                if not name or name.startswith('Reserve') or name.startswith('---'):
+            # Iterate the file lazily; it is never held in memory as a list of lines
+            for line in f:
+                line = line.strip()
+                
+                # Look for CAN ID in headers like "### GET_SOC_1 (0x18F81280)"
+                if line.startswith('###') and '(0x' in line:
+                    try:
+                        hex_start = line.find('(0x') + 3
+                        hex_end = line.find(')', hex_start)
+                        if hex_end > hex_start:
+                            current_can_id = int(line[hex_start:hex_end], 16)
+                    except ValueError:
+                        current_can_id = None
                     continue
                 
-                # Parse bit_start - handle both numeric and non-numeric
-                bit_start_str = parts[2].strip()
-                try:
-                    bit_start = int(bit_start_str)
-                except ValueError:
+                if not line.startswith('|') or '---' in line or current_can_id is None:
                     continue
                 
-                # Parse bit_length
-                bit_length_str = parts[3].strip()
-                try:
-                    bit_length = int(bit_length_str)
-                except ValueError:
-                    bit_length = 8
+                # Cells come out stripped and without bold markers ('**' never spans a '|')
+                parts = [p.strip() for p in line.replace('**', '').split('|')[1:-1]]
+                if len(parts) < 4:
+                    continue
+                
+                # Skip header rows
+                if 'Signal' in parts[0] or 'Variable' in parts[0] or 'name' in parts[0].lower():
+                    continue
                 
-                # Parse factor
-                factor = 1.0
-                if len(parts) > 4 and parts[4].strip():
+                try:
+                    name = parts[0]
+                    # ('---' separator rows never get here; see the line check above)
+                    if not name or name.startswith('Reserve'):
+                        continue
+                    
+                    # Parse bit_start - handle both numeric and non-numeric
                     try:
-                        factor = float(parts[4].strip())
+                        bit_start = int(parts[2])
                     except ValueError:
-                        factor = 1.0
-                
-                # Parse unit
-                unit = parts[5].strip() if len(parts) > 5 else ''
-                # Clean up unit (remove ? and extra chars)
-                unit = unit.replace('?', '').strip()
-                
-                if current_can_id not in self.signal_database:
-                    self.signal_database[current_can_id] = []
-                self.signal_database[current_can_id].append({
-                    'name': name[:15], 'bit_start': bit_start,
-                    'bit_length': bit_length, 'factor': factor, 'unit': unit
-                })
-                count += 1
-            except (ValueError, IndexError):
-                continue
+                        continue
+                    
+                    # Parse bit_length
+                    try:
+                        bit_length = int(parts[3])
+                    except ValueError:
+                        bit_length = 8
+                    
+                    # Parse factor
+                    factor = 1.0
+                    if len(parts) > 4 and parts[4]:
+                        try:
+                            factor = float(parts[4])
+                        except ValueError:
+                            factor = 1.0
+                    
+                    # Parse unit
+                    unit = parts[5] if len(parts) > 5 else ''
+                    # Clean up unit (remove ? and extra chars)
+                    unit = unit.replace('?', '').strip()
+                    
+                    entries.append((current_can_id, {
+                        'name': name[:15], 'bit_start': bit_start,
+                        'bit_length': bit_length, 'factor': factor, 'unit': unit
+                    }))
+                except (ValueError, IndexError):
+                    continue
         
-        return count
-    
-    def _process_csv_row(self, row: list) -> bool:
-        """Process a single CSV row for ID database"""
-        if len(row) < 2:
-            return False
-        try:
-            id_str = row[0].strip().replace('0x', '').replace('h', '')
-            msg_id = int(id_str, 16)
-            name = row[1].strip()
-            if msg_id and name:
-                self.id_database[msg_id] = name
-                return True
-        except (ValueError, IndexError):
-            pass
-        return False
+        return entries
     
     # === Header Click for HEX/Decimal/Decoded Toggle ===
     
@@ -2013,65 +2535,67 @@ class MainWindow(QMainWindow):
             
             # Update header text to show current mode
             mode_text = {'hex': 'Data (HEX)', 'decimal': 'Data (Decimal)', 'decoded': 'Data (Decoded)'}[self.display_mode]
-            headers = ["Timestamp", "CAN-ID", "Name", "Type", "Length", 
-                      mode_text, "Cycle Time", "Count"]
-            self.receive_table.setHorizontalHeaderLabels(headers)
-            self._update_receive_table()
-            self._save_settings()
-    
-    def _decode_signals(self, msg_id: int, data: bytes) -> str:
-        """Decode CAN data using signal definitions"""
-        if msg_id not in self.signal_database:
-            return " ".join(f"{b:02X}" for b in data)  # Fallback to HEX
-        
+            # Same rows, only the Data column repaints
+            self.receive_model.set_data_header(mode_text)
+            self._request_save()
+    
+    def _signal_layout(self, msg_id: int, length: int) -> Tuple[list, str]:
+        """
+        Compiled decode layout for a CAN ID's frames of the given length (bytes), cached
+        until its signal list changes. Returns one (shift, mask, factor) tuple per signal
+        that fits the frame and a single template; template.format(*values), with each
+        value ((word >> shift) & mask) * factor, gives the 'Name:value unit ...' text.
+        """
         signals = self.signal_database[msg_id]
-        parts = []
-        
+        key = (msg_id, length)
+        cached = self._signal_layouts.get(key)
+        if cached is not None and cached[0] is signals and cached[1] == len(signals):
+            return cached[2]
+        
+        total_bits = length * 8
+        fields = []
+        templates = []
         for sig in signals:
             try:
                 bit_start = sig.get('bit_start', 0)
                 bit_length = sig.get('bit_length', 8)
                 factor = sig.get('factor', 1) or 1
-                unit = sig.get('unit', '').replace('�', '').replace('—', '')
-                name = sig.get('name', 'Sig').replace('�', '').replace('—', '')
-                
-                # Extract value from bytes
-                byte_start = bit_start // 8
-                bit_offset = bit_start % 8
-                bytes_needed = (bit_length + bit_offset + 7) // 8
-                
-                if byte_start + bytes_needed > len(data):
+                unit = sig.get('unit', '').translate(_SIGNAL_TEXT_JUNK)
+                name = sig.get('name', 'Sig').translate(_SIGNAL_TEXT_JUNK)
+                if bit_start < 0 or bit_length < 0 or not isinstance(factor, (int, float)):
                     continue
-                
-                # Extract raw value (big endian)
-                raw_value = 0
-                for i in range(bytes_needed):
-                    if byte_start + i < len(data):
-                        raw_value = (raw_value << 8) | data[byte_start + i]
-                
-                # Apply bit mask and shift
-                total_bits = bytes_needed * 8
-                shift = total_bits - bit_offset - bit_length
-                if shift >= 0:
-                    raw_value = (raw_value >> shift) & ((1 << bit_length) - 1)
-                
-                # Apply factor
-                value = raw_value * factor
-                
-                # Format output - shorter names for display
-                short_name = name[:8]  # Truncate to 8 chars for compact display
-                if factor != 1 and factor != 0:
-                    parts.append(f"{short_name}:{value:.1f}{unit}")
+                # Shorter names for display: truncate to 8 chars
+                prefix = name[:8].replace('{', '{{').replace('}', '}}')
+                suffix = unit.replace('{', '{{').replace('}', '}}')
+                # Bit 0 is the MSB of byte 0, so the field ends shift bits above the LSB
+                shift = total_bits - bit_start - bit_length
+                if shift < 0:
+                    continue
+                if factor == 1:
+                    # Unscaled: integer factor keeps raw * factor an int
+                    factor = 1
+                    templates.append(prefix + ":{}" + suffix)
                 else:
-                    parts.append(f"{short_name}:{int(value)}{unit}")
-                    
+                    templates.append(prefix + ":{:.1f}" + suffix)
+                fields.append((shift, (1 << bit_length) - 1, factor))
             except Exception:
                 continue
+        layout = (fields, " ".join(templates))
+        self._signal_layouts[key] = (signals, len(signals), layout)
+        return layout
+    
+    def _decode_signals(self, msg_id: int, data: bytes) -> str:
+        """Decode CAN data using signal definitions"""
+        if msg_id not in self.signal_database:
+            return data.hex(' ').upper()  # Fallback to HEX
         
-        if parts:
-            return " ".join(parts)
-        else:
-            return " ".join(f"{b:02X}" for b in data)  # Fallback
+        fields, template = self._signal_layout(msg_id, len(data))
+        if not fields:
+            return data.hex(' ').upper()  # Fallback
+        
+        # Whole frame as one big-endian integer; signals past its end are not in the layout
+        word = _unpack_u64(data)[0] if len(data) == 8 else int.from_bytes(data, 'big')
+        return template.format(*[((word >> shift) & mask) * factor for shift, mask, factor in fields])
     
     # === Edit Rule ===
     
@@ -2087,7 +2611,7 @@ class MainWindow(QMainWindow):
             return
         
         # Get original rule
-        original_rule = self.can_manager._response_rules[row]
+        original_rule = rules[row]
         
         dialog = AddRuleDialog(self, original_rule)
         if dialog.exec() == QDialog.DialogCode.Accepted:
@@ -2101,6 +2625,9 @@ class MainWindow(QMainWindow):
     
     def _sim_start(self):
         """Start or resume the simulation"""
+        # Any click supersedes a profile still being generated
+        self._sim_request += 1
+        request = self._sim_request
         if self.sim_engine.is_paused:
             self.sim_engine.start()
             return
@@ -2113,9 +2640,23 @@ class MainWindow(QMainWindow):
         
         profile_info = self._available_profiles[idx]
         profile = profile_info.get('_loaded_profile')
-        if not profile and profile_info.get('generator'):
-            profile = profile_info['generator'](**profile_info['kwargs'])
+        generator = profile_info.get('generator')
+        if profile or not generator:
+            self._sim_play(profile)
+            return
+        
+        # Long trips take a while to generate: build the profile on the thread pool
+        kwargs = profile_info['kwargs']
+        
+        def generated(_name: str, profile):
+            if request == self._sim_request:  # not superseded by a later click
+                self._sim_play(profile)
         
+        self._start_file_task(lambda _name: generator(**kwargs), profile_info['name'],
+                              generated, "Failed to generate profile")
+    
+    def _sim_play(self, profile):
+        """Load a profile into the engine and start it"""
         self.sim_engine.load_profile(profile)
         
         # Apply current speed
@@ -2134,29 +2675,29 @@ class MainWindow(QMainWindow):
         if not filepath:
             return
         
-        try:
-            profile = TripProfileGenerator.load_csv_profile(filepath)
-            # Add to combo and select it
-            import os
-            name = f"CSV: {os.path.basename(filepath)}"
-            self._available_profiles.append({
-                'name': name,
-                'generator': None,  # Already generated
-                'kwargs': {},
-                'description': f'Real trip data ({profile.point_count} points, {profile.duration_min:.0f} min)',
-                '_loaded_profile': profile  # Store the loaded profile
-            })
-            self.sim_profile_combo.addItem(name)
-            self.sim_profile_combo.setCurrentIndex(self.sim_profile_combo.count() - 1)
-            
-            QMessageBox.information(self, "CSV Imported",
-                f"Loaded trip profile:\n"
-                f"• {profile.point_count} data points\n"
-                f"• Duration: {profile.duration_min:.1f} min\n"
-                f"• Voltage: {profile.data_points[0].voltage_V:.1f}V → {profile.data_points[-1].voltage_V:.1f}V\n"
-                f"• Max speed: {max(dp.speed_kmh for dp in profile.data_points)} km/h")
-        except Exception as e:
-            QMessageBox.warning(self, "Import Error", f"Failed to load CSV:\n{str(e)}")
+        self._start_file_task(TripProfileGenerator.load_csv_profile, filepath,
+                              self._on_sim_csv_loaded, "Failed to load CSV")
+    
+    def _on_sim_csv_loaded(self, filepath: str, profile):
+        """Add a loaded CSV trip profile to the profile list (GUI thread)"""
+        # Add to combo and select it
+        name = f"CSV: {os.path.basename(filepath)}"
+        self._available_profiles.append({
+            'name': name,
+            'generator': None,  # Already generated
+            'kwargs': {},
+            'description': f'Real trip data ({profile.point_count} points, {profile.duration_min:.0f} min)',
+            '_loaded_profile': profile  # Store the loaded profile
+        })
+        self.sim_profile_combo.addItem(name)
+        self.sim_profile_combo.setCurrentIndex(self.sim_profile_combo.count() - 1)
+        
+        QMessageBox.information(self, "CSV Imported",
+            f"Loaded trip profile:\n"
+            f"• {profile.point_count} data points\n"
+            f"• Duration: {profile.duration_min:.1f} min\n"
+            f"• Voltage: {profile.data_points[0].voltage_V:.1f}V → {profile.data_points[-1].voltage_V:.1f}V\n"
+            f"• Max speed: {max(dp.speed_kmh for dp in profile.data_points)} km/h")
     
     def _sim_pause(self):
         """Pause/resume the simulation"""
@@ -2170,6 +2711,7 @@ class MainWindow(QMainWindow):
     
     def _sim_stop(self):
         """Stop the simulation"""
+        self._sim_request += 1  # drop a profile still being generated
         self.sim_engine.stop()
         self._on_sim_finished()
     
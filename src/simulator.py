@@ -6,10 +6,12 @@ import csv
 import math
 import os
 import random
+import struct
+import time
 from dataclasses import dataclass, field
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Tuple
 
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+from PyQt6.QtCore import QObject, Qt, pyqtSignal, QTimer
 
 
 # === CAN Signal Definitions ===
@@ -33,9 +35,9 @@ MCU_CAN_ID = 0x18F86890
 # Flags: bits 48-63 (motor fail, grip fail, brake fail, etc.)
 
 
-@dataclass
+@dataclass(slots=True)
 class TripDataPoint:
-    """Single data point in a trip profile"""
+    """Single data point in a trip profile (slotted: profiles hold thousands)"""
     time_s: float       # Seconds into trip
     voltage_V: float    # Battery voltage (60-84V for 72V NMC pack)
     current_A: float    # Current (positive = discharge, negative = regen)
@@ -80,13 +82,39 @@ class TripProfileGenerator:
     MAX_PEAK_A = 250.0          # Peak current (5 seconds)
     REGEN_EFFICIENCY = 0.7      # Regenerative braking efficiency
 
+    # Gear by integer speed (km/h); faster speeds use the last entry
+    _CITY_GEARS = (0,) + (1,) * 14 + (2,) * 15 + (3,) * 15 + (4,)
+    _HIGHWAY_GEARS = (1,) * 15 + (2,) * 15 + (3,) * 15 + (4,) * 15 + (5,)
+    # Gear by CSV driving mode; unknown modes count as normal
+    _MODE_GEARS = {
+        'park': 0, 'p': 0, '': 0,
+        'eco': 1, 'e': 1,
+        'normal': 2, 'n': 2, 'd': 2,
+        'sport': 3, 's': 3,
+    }
+
+    # Pack voltage per 0.1 % SOC step, built on first use
+    _voltage_lut: Optional[tuple] = None
+
     @classmethod
     def _voltage_from_soc(cls, soc_pct: float) -> float:
         """
-        NMC lithium-ion voltage curve (20S pack).
+        NMC lithium-ion voltage curve (20S pack), looked up in 0.1 % SOC steps.
         SOC 100% -> ~84V, SOC 0% -> ~60V
         """
-        s = max(0.0, min(1.0, soc_pct / 100.0))
+        return cls._voltage_table()[max(0, min(1000, round(soc_pct * 10)))]
+
+    @classmethod
+    def _voltage_table(cls) -> tuple:
+        """Pack voltage indexed by SOC in 0.1 % steps (0-1000)"""
+        lut = cls._voltage_lut
+        if lut is None:
+            lut = cls._voltage_lut = tuple(cls._voltage_curve(i / 1000.0) for i in range(1001))
+        return lut
+
+    @classmethod
+    def _voltage_curve(cls, s: float) -> float:
+        """Pack voltage for a state of charge s in 0..1"""
         # NMC cell: steep at top, flat middle, steep drop at bottom
         v_norm = (
             0.05 * math.exp(-20 * (1 - s))   # High-SOC steep region
@@ -101,10 +129,12 @@ class TripProfileGenerator:
                            start_soc: float = 85.0,
                            soh: float = 95.0,
                            fc_cycles: int = 120,
-                           start_odometer: int = 1250) -> TripProfile:
+                           start_odometer: int = 1250,
+                           seed: Optional[int] = None) -> TripProfile:
         """
         City trip: stop-and-go traffic with variable speed.
         Includes regenerative braking when decelerating.
+        The same seed reproduces the same trip.
         """
         profile = TripProfile(
             name="City Trip",
@@ -121,68 +151,74 @@ class TripProfileGenerator:
         target_speed = 0
         next_event = 0
 
+        # Loop invariants and hot lookups bound once instead of per second
+        step_h = step_s / 3600.0
+        nominal_v = cls.PACK_VOLTAGE_NOMINAL
+        total_energy_wh = cls.PACK_CAPACITY_AH * nominal_v
+        regen_efficiency = cls.REGEN_EFFICIENCY
+        max_current = cls.MAX_CONTINUOUS_A
+        voltage_lut = cls._voltage_table()
+        gears = cls._CITY_GEARS
+        top_speed = len(gears) - 1
+        # Own generator: reproducible per seed, and not shared across pool threads
+        rng = random.Random(seed)
+        rand, randint, uniform = rng.random, rng.randint, rng.uniform
+        append = profile.data_points.append
+
         for t in range(0, total_seconds + 1, int(step_s)):
             if t >= next_event:
-                r = random.random()
+                r = rand()
                 if r < 0.15:
                     target_speed = 0
-                    next_event = t + random.randint(8, 25)
+                    next_event = t + randint(8, 25)
                 elif r < 0.40:
-                    target_speed = random.randint(15, 30)
-                    next_event = t + random.randint(15, 40)
+                    target_speed = randint(15, 30)
+                    next_event = t + randint(15, 40)
                 elif r < 0.75:
-                    target_speed = random.randint(30, 50)
-                    next_event = t + random.randint(20, 50)
+                    target_speed = randint(30, 50)
+                    next_event = t + randint(20, 50)
                 else:
-                    target_speed = random.randint(45, 60)
-                    next_event = t + random.randint(10, 30)
+                    target_speed = randint(45, 60)
+                    next_event = t + randint(10, 30)
 
             prev_speed = speed
             if speed < target_speed:
-                speed = min(speed + random.uniform(1.5, 3.5), target_speed)
+                speed = min(speed + uniform(1.5, 3.5), target_speed)
             elif speed > target_speed:
-                speed = max(speed - random.uniform(2.0, 5.0), target_speed)
+                speed = max(speed - uniform(2.0, 5.0), target_speed)
 
-            speed_int = max(0, int(round(speed)))
+            speed_int = max(0, round(speed))
             decel = prev_speed - speed  # Positive when decelerating
 
             # Current: discharge when driving, regen when braking
             if speed_int == 0 and decel <= 0:
-                current = random.uniform(0.5, 2.0)  # Idle draw
+                current = uniform(0.5, 2.0)  # Idle draw
             elif decel > 1.0 and speed_int > 5:
                 # Regenerative braking — negative current
-                regen_current = decel * 3.0 * cls.REGEN_EFFICIENCY + random.uniform(-2, 2)
+                regen_current = decel * 3.0 * regen_efficiency + uniform(-2, 2)
                 current = -max(1.0, min(regen_current, 30.0))
             else:
-                base_current = speed_int * 0.8 + random.uniform(-3, 5)
-                current = max(1.0, min(base_current, cls.MAX_CONTINUOUS_A))
+                base_current = speed_int * 0.8 + uniform(-3, 5)
+                current = max(1.0, min(base_current, max_current))
 
             # SOC change (positive current = discharge, negative = charge/regen)
-            energy_wh = current * cls.PACK_VOLTAGE_NOMINAL * (step_s / 3600.0)
-            total_energy_wh = cls.PACK_CAPACITY_AH * cls.PACK_VOLTAGE_NOMINAL
+            energy_wh = current * nominal_v * step_h
             soc -= (energy_wh / total_energy_wh) * 100.0
             soc = max(0, min(100, soc))
 
-            trip_km += speed_int * (step_s / 3600.0)
+            trip_km += speed_int * step_h
 
-            if speed_int == 0:
-                gear = 0
-            elif speed_int < 15:
-                gear = 1
-            elif speed_int < 30:
-                gear = 2
-            elif speed_int < 45:
-                gear = 3
-            else:
-                gear = 4
+            gear = gears[min(speed_int, top_speed)]
 
-            voltage = cls._voltage_from_soc(soc)
+            # SOC in 0.1 % steps: the stored value and the voltage table index
+            soc_dpct = round(soc * 10)
+            voltage = voltage_lut[soc_dpct]
 
-            profile.data_points.append(TripDataPoint(
+            append(TripDataPoint(
                 time_s=float(t),
                 voltage_V=voltage,
                 current_A=round(current, 2),
-                soc_pct=round(soc, 1),
+                soc_pct=soc_dpct / 10,
                 soh_pct=soh,
                 fc_cycles=fc_cycles,
                 speed_kmh=speed_int,
@@ -201,10 +237,12 @@ class TripProfileGenerator:
                                start_soc: float = 95.0,
                                soh: float = 92.0,
                                fc_cycles: int = 200,
-                               start_odometer: int = 5200) -> TripProfile:
+                               start_odometer: int = 5200,
+                               seed: Optional[int] = None) -> TripProfile:
         """
         Highway trip: steady high speed with minor variations.
         Includes occasional regen during speed adjustments.
+        The same seed reproduces the same trip.
         """
         profile = TripProfile(
             name="Highway Trip",
@@ -218,54 +256,60 @@ class TripProfileGenerator:
         speed = 0.0
         prev_speed = 0.0
         trip_km = 0.0
-        cruise_speed = random.randint(55, 70)
+        # Own generator: reproducible per seed, and not shared across pool threads
+        rng = random.Random(seed)
+        cruise_speed = rng.randint(55, 70)
         accel_time = 30
 
+        # Loop invariants and hot lookups bound once instead of per second
+        step_h = step_s / 3600.0
+        nominal_v = cls.PACK_VOLTAGE_NOMINAL
+        total_energy_wh = cls.PACK_CAPACITY_AH * nominal_v
+        regen_efficiency = cls.REGEN_EFFICIENCY
+        max_current = cls.MAX_CONTINUOUS_A
+        voltage_lut = cls._voltage_table()
+        gears = cls._HIGHWAY_GEARS
+        top_speed = len(gears) - 1
+        uniform = rng.uniform
+        append = profile.data_points.append
+
         for t in range(0, total_seconds + 1, int(step_s)):
             prev_speed = speed
             if t < accel_time:
                 speed = cruise_speed * (t / accel_time)
             else:
-                speed = cruise_speed + random.uniform(-3, 3)
+                speed = cruise_speed + uniform(-3, 3)
 
-            speed_int = max(0, int(round(speed)))
+            speed_int = max(0, round(speed))
             decel = prev_speed - speed
 
             # Current with regen during deceleration
             if decel > 1.0 and speed_int > 10:
-                regen_current = decel * 4.0 * cls.REGEN_EFFICIENCY + random.uniform(-1, 2)
+                regen_current = decel * 4.0 * regen_efficiency + uniform(-1, 2)
                 current = -max(1.0, min(regen_current, 40.0))
             elif t < accel_time:
-                current = speed_int * 1.2 + random.uniform(0, 8)
+                current = speed_int * 1.2 + uniform(0, 8)
             else:
-                current = cruise_speed * 0.7 + random.uniform(-2, 4)
-            current = max(-40.0, min(current, cls.MAX_CONTINUOUS_A))
+                current = cruise_speed * 0.7 + uniform(-2, 4)
+            current = max(-40.0, min(current, max_current))
 
-            energy_wh = current * cls.PACK_VOLTAGE_NOMINAL * (step_s / 3600.0)
-            total_energy_wh = cls.PACK_CAPACITY_AH * cls.PACK_VOLTAGE_NOMINAL
+            energy_wh = current * nominal_v * step_h
             soc -= (energy_wh / total_energy_wh) * 100.0
             soc = max(0, min(100, soc))
 
-            trip_km += speed_int * (step_s / 3600.0)
+            trip_km += speed_int * step_h
 
-            if speed_int < 15:
-                gear = 1
-            elif speed_int < 30:
-                gear = 2
-            elif speed_int < 45:
-                gear = 3
-            elif speed_int < 60:
-                gear = 4
-            else:
-                gear = 5
+            gear = gears[min(speed_int, top_speed)]
 
-            voltage = cls._voltage_from_soc(soc)
+            # SOC in 0.1 % steps: the stored value and the voltage table index
+            soc_dpct = round(soc * 10)
+            voltage = voltage_lut[soc_dpct]
 
-            profile.data_points.append(TripDataPoint(
+            append(TripDataPoint(
                 time_s=float(t),
                 voltage_V=voltage,
                 current_A=round(current, 2),
-                soc_pct=round(soc, 1),
+                soc_pct=soc_dpct / 10,
                 soh_pct=soh,
                 fc_cycles=fc_cycles,
                 speed_kmh=speed_int,
@@ -302,6 +346,13 @@ class TripProfileGenerator:
         target_soc = 100.0
         charge_current_max = 20.0  # 20A charge rate (0.5C for 40Ah)
 
+        # Loop invariants and hot lookups bound once instead of per second
+        step_h = step_s / 3600.0
+        nominal_v = cls.PACK_VOLTAGE_NOMINAL
+        total_energy_wh = cls.PACK_CAPACITY_AH * nominal_v
+        voltage_lut = cls._voltage_table()
+        append = profile.data_points.append
+
         for t in range(0, total_seconds + 1, int(step_s)):
             # CC phase (constant current until ~80%)
             if soc < 80:
@@ -312,18 +363,19 @@ class TripProfileGenerator:
                 current = -charge_current_max * taper
 
             # SOC increase (charging)
-            energy_wh = abs(current) * cls.PACK_VOLTAGE_NOMINAL * (step_s / 3600.0)
-            total_energy_wh = cls.PACK_CAPACITY_AH * cls.PACK_VOLTAGE_NOMINAL
+            energy_wh = abs(current) * nominal_v * step_h
             soc += (energy_wh / total_energy_wh) * 100.0
-            soc = min(target_soc, soc)
+            soc = max(0, min(target_soc, soc))
 
-            voltage = cls._voltage_from_soc(soc)
+            # SOC in 0.1 % steps: the stored value and the voltage table index
+            soc_dpct = round(soc * 10)
+            voltage = voltage_lut[soc_dpct]
 
-            profile.data_points.append(TripDataPoint(
+            append(TripDataPoint(
                 time_s=float(t),
                 voltage_V=voltage,
                 current_A=round(abs(current), 2),  # Display as positive
-                soc_pct=round(soc, 1),
+                soc_pct=soc_dpct / 10,
                 soh_pct=soh,
                 fc_cycles=fc_cycles,
                 speed_kmh=0,
@@ -394,14 +446,14 @@ class TripProfileGenerator:
             description=f"Real trip data from {filename}"
         )
 
-        with open(filepath, 'r', encoding='utf-8-sig') as f:
-            lines = f.readlines()
+        with open(filepath, 'r', encoding='utf-8-sig', newline='') as f:
+            rows = list(csv.reader(f))
 
-        if len(lines) < 3:
+        if len(rows) < 3:
             raise ValueError("CSV file too short — need header + data rows")
 
         # Parse header (first line) to find column indices
-        header = lines[0].strip().split(',')
+        header = rows[0]
         col_map = {
             'time': -1, 'voltage': -1, 'current': -1,
             'speed_kmh': -1, 'km_total': -1, 'km_current': -1,
@@ -445,59 +497,52 @@ class TripProfileGenerator:
         def safe_int(val: str, default: int = 0) -> int:
             return int(safe_float(val, float(default)))
 
-        def mode_to_gear(mode_str: str) -> int:
-            """Map driving mode string to gear value"""
-            mode = mode_str.strip().lower()
-            if mode in ('park', 'p', ''):
-                return 0
-            elif mode in ('eco', 'e'):
-                return 1
-            elif mode in ('normal', 'n', 'd'):
-                return 2
-            elif mode in ('sport', 's'):
-                return 3
-            else:
-                return 2  # Default to normal
+        mode_gears = cls._MODE_GEARS
 
-        # Estimate SOC from voltage using the pack voltage range
+        # Single pass over the rows: parse the data rows, and track the
+        # voltage range used for SOC estimation below
         # User's pack: ~75V full, ~60V empty (higher than our default constants)
         # We'll detect the actual range from the data
-        voltages = []
-        for line in lines[2:]:
-            parts = line.strip().split(',')
-            if len(parts) > col_map['voltage'] and parts[col_map['time']].strip():
-                v = safe_float(parts[col_map['voltage']])
-                if v > 0:
-                    voltages.append(v)
-
-        if not voltages:
-            raise ValueError("No valid voltage data found in CSV")
+        v_min = math.inf
+        v_max = 0.0
+        samples = []
+        for parts in rows[2:]:
+            time_str = parts[col_map['time']].strip() if col_map['time'] < len(parts) else ''
+            if not time_str:
+                continue
 
-        v_max = max(voltages)
-        v_min = min(voltages)
-        # Add small margin for SOC estimation
-        v_range_full = v_max + 1.0  # Slightly above observed max
-        v_range_empty = max(v_min - 5.0, v_max * 0.65)  # ~65% of max as empty
+            voltage = safe_float(parts[col_map['voltage']] if col_map['voltage'] < len(parts) else '0')
+            if voltage > 0:
+                if voltage < v_min:
+                    v_min = voltage
+                if voltage > v_max:
+                    v_max = voltage
 
-        # Parse data rows (skip header rows)
-        for line in lines[2:]:
-            parts = line.strip().split(',')
-            time_str = parts[col_map['time']].strip() if col_map['time'] < len(parts) else ''
-            if not time_str or time_str.startswith('#'):
+            if time_str.startswith('#'):
                 continue
 
             time_s = safe_float(time_str)
-            if time_s <= 0 and len(profile.data_points) > 0:
+            if time_s <= 0 and samples:
                 continue
 
-            voltage = safe_float(parts[col_map['voltage']] if col_map['voltage'] < len(parts) else '0')
             current = abs(safe_float(parts[col_map['current']] if col_map['current'] < len(parts) else '0'))
             speed = safe_int(parts[col_map['speed_kmh']] if col_map['speed_kmh'] >= 0 and col_map['speed_kmh'] < len(parts) else '0')
             km_total = safe_int(parts[col_map['km_total']] if col_map['km_total'] >= 0 and col_map['km_total'] < len(parts) else '0')
             km_current_raw = safe_float(parts[col_map['km_current']] if col_map['km_current'] >= 0 and col_map['km_current'] < len(parts) else '0')
             km_current = int(km_current_raw)
             mode_str = parts[col_map['mode']].strip() if col_map['mode'] >= 0 and col_map['mode'] < len(parts) else ''
+            gear = mode_gears.get(mode_str.lower(), 2)
+
+            samples.append((time_s, voltage, current, speed, km_total, km_current, gear))
+
+        if not v_max:
+            raise ValueError("No valid voltage data found in CSV")
+
+        # Add small margin for SOC estimation
+        v_range_full = v_max + 1.0  # Slightly above observed max
+        v_range_empty = max(v_min - 5.0, v_max * 0.65)  # ~65% of max as empty
 
+        for time_s, voltage, current, speed, km_total, km_current, gear in samples:
             # Estimate SOC from voltage (linear mapping within observed range)
             if v_range_full > v_range_empty:
                 soc = ((voltage - v_range_empty) / (v_range_full - v_range_empty)) * 100.0
@@ -505,8 +550,6 @@ class TripProfileGenerator:
             else:
                 soc = 50.0
 
-            gear = mode_to_gear(mode_str)
-
             profile.data_points.append(TripDataPoint(
                 time_s=time_s,
                 voltage_V=round(voltage, 1),
@@ -530,7 +573,13 @@ class TripProfileGenerator:
 
 # === CAN Frame Encoding ===
 
-def encode_bms_frame(dp: TripDataPoint) -> List[int]:
+# Voltage, current, SOC, SOH, cycles
+_pack_bms = struct.Struct('>HHBBH').pack
+# Speed + 24-bit total mileage, current mileage, gear byte, flags + reserved
+_pack_mcu = struct.Struct('>IBBH').pack
+
+
+def encode_bms_frame(dp: TripDataPoint) -> bytes:
     """
     Encode BMS data point into 8 CAN data bytes for GET_SOC_1 (0x18F81280).
 
@@ -542,29 +591,22 @@ def encode_bms_frame(dp: TripDataPoint) -> List[int]:
       Byte 6-7: Full Charge Cycles (16-bit, factor 1, big-endian)
     """
     # Voltage: value / factor = raw
-    v_raw = int(round(dp.voltage_V / 0.1))
+    v_raw = round(dp.voltage_V / 0.1)
     v_raw = max(0, min(v_raw, 0xFFFF))
 
     # Current: use absolute value for encoding (factor 0.05)
-    c_raw = int(round(abs(dp.current_A) / 0.05))
+    c_raw = round(abs(dp.current_A) / 0.05)
     c_raw = max(0, min(c_raw, 0xFFFF))
 
-    soc = max(0, min(int(round(dp.soc_pct)), 255))
-    soh = max(0, min(int(round(dp.soh_pct)), 255))
+    soc = max(0, min(round(dp.soc_pct), 255))
+    soh = max(0, min(round(dp.soh_pct), 255))
 
     fc = max(0, min(dp.fc_cycles, 0xFFFF))
 
-    data = [
-        (v_raw >> 8) & 0xFF, v_raw & 0xFF,         # Voltage BE
-        (c_raw >> 8) & 0xFF, c_raw & 0xFF,         # Current BE
-        soc,                                         # SOC
-        soh,                                         # SOH
-        (fc >> 8) & 0xFF, fc & 0xFF,               # FC Cycles BE
-    ]
-    return data
+    return _pack_bms(v_raw, c_raw, soc, soh, fc)
 
 
-def encode_mcu_frame(dp: TripDataPoint) -> List[int]:
+def encode_mcu_frame(dp: TripDataPoint) -> bytes:
     """
     Encode MCU data point into 8 CAN data bytes for GET_MCU_KM (0x18F86890).
 
@@ -579,18 +621,11 @@ def encode_mcu_frame(dp: TripDataPoint) -> List[int]:
     speed = max(0, min(dp.speed_kmh, 255))
 
     total_km = max(0, min(dp.total_mileage_km, 0xFFFFFF))
-    current_km = max(0, min(int(round(dp.current_mileage_km)), 255))
+    current_km = max(0, min(round(dp.current_mileage_km), 255))
     gear = max(0, min(dp.gear, 7))
 
-    data = [
-        speed,                                                         # Speed
-        (total_km >> 16) & 0xFF, (total_km >> 8) & 0xFF, total_km & 0xFF,  # Total mileage BE
-        current_km,                                                    # Current mileage
-        (gear & 0x07) << 5,                                           # Gear in bits 5-7
-        0x00,                                                          # Flags (no faults)
-        0x00,                                                          # Reserved
-    ]
-    return data
+    # Speed shares the first big-endian word with the 24-bit total mileage
+    return _pack_mcu((speed << 24) | total_km, current_km, gear << 5, 0)
 
 
 class SimulationEngine(QObject):
@@ -607,16 +642,25 @@ class SimulationEngine(QObject):
     simulation_paused = pyqtSignal(bool)        # True = paused, False = resumed
     status_message = pyqtSignal(str)            # Status text for status bar
 
+    # Minimum spacing of live UI updates (~20 Hz); frames are still sent every tick
+    UI_UPDATE_INTERVAL_NS = 50_000_000
+    # Status bar text while running: profile, SOC, voltage, current, speed, playback speed
+    STATUS_TEMPLATE = "🔄 %s — SOC: %.0f%% | %.1fV | %.1fA | %d km/h | x%.0f"
+
     def __init__(self, can_manager):
         super().__init__()
         self._can_manager = can_manager
         self._profile: Optional[TripProfile] = None
+        # Per data point: the BMS and MCU frames as (can_id, payload, is_extended)
+        self._points: List[TripDataPoint] = []  # data points of the loaded profile
+        self._frames: List[Tuple[Tuple[int, bytes, bool], ...]] = []
         self._timer: Optional[QTimer] = None
         self._current_index: int = 0
         self._is_running: bool = False
         self._is_paused: bool = False
         self._playback_speed: float = 1.0
         self._send_interval_ms: int = 250  # Base interval between sends
+        self._last_ui_emit_ns: int = 0
 
     @property
     def is_running(self) -> bool:
@@ -652,7 +696,12 @@ class SimulationEngine(QObject):
         """Load a trip profile for simulation"""
         self.stop()
         self._profile = profile
+        self._points = profile.data_points
         self._current_index = 0
+        # Profiles don't change once loaded: encode every frame up front, not per tick
+        self._frames = [((BMS_CAN_ID, encode_bms_frame(dp), True),
+                         (MCU_CAN_ID, encode_mcu_frame(dp), True))
+                        for dp in profile.data_points]
 
     def start(self) -> bool:
         """Start or resume the simulation"""
@@ -674,6 +723,7 @@ class SimulationEngine(QObject):
 
         # Fresh start
         self._current_index = 0
+        self._last_ui_emit_ns = 0
         self._is_running = True
         self._is_paused = False
 
@@ -682,7 +732,9 @@ class SimulationEngine(QObject):
         # At 250ms interval and 1x speed, we advance ~0.25s per tick
         # We'll just advance by time matching
 
+        # Precise timer: the default coarse one may fire up to 5 % late, bunching frames
         self._timer = QTimer()
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
         self._timer.timeout.connect(self._tick)
         self._timer.start(self._effective_interval_ms)
 
@@ -714,7 +766,9 @@ class SimulationEngine(QObject):
         if not self._profile or not self._is_running:
             return
 
-        if self._current_index >= len(self._profile.data_points):
+        index = self._current_index
+        points = self._points
+        if index >= len(points):
             # Simulation complete
             self._is_running = False
             if self._timer:
@@ -724,41 +778,36 @@ class SimulationEngine(QObject):
             self.status_message.emit(f"✓ Simulation complete: {self._profile.name}")
             return
 
-        dp = self._profile.data_points[self._current_index]
-
-        # Encode and send BMS frame
-        bms_data = encode_bms_frame(dp)
-        self._can_manager.send_message(BMS_CAN_ID, bms_data, is_extended=True)
-
-        # Encode and send MCU frame
-        mcu_data = encode_mcu_frame(dp)
-        self._can_manager.send_message(MCU_CAN_ID, mcu_data, is_extended=True)
-
-        # Calculate progress
-        progress = int((self._current_index / len(self._profile.data_points)) * 100)
-        self.progress_changed.emit(progress)
-
-        # Emit current data for UI display
-        self.data_updated.emit({
-            'time_s': dp.time_s,
-            'voltage': dp.voltage_V,
-            'current': dp.current_A,
-            'soc': dp.soc_pct,
-            'soh': dp.soh_pct,
-            'speed': dp.speed_kmh,
-            'mileage': dp.current_mileage_km,
-            'gear': dp.gear,
-        })
-
-        # Update status bar
-        self.status_message.emit(
-            f"🔄 {self._profile.name} — "
-            f"SOC: {dp.soc_pct:.0f}% | "
-            f"{dp.voltage_V:.1f}V | "
-            f"{dp.current_A:.1f}A | "
-            f"{dp.speed_kmh} km/h | "
-            f"x{self._playback_speed:.0f}"
-        )
+        # Send the pre-encoded BMS and MCU frames in one call
+        self._can_manager.send_batch(self._frames[index])
+
+        # Progress, live values and status text: the UI can't repaint at
+        # fast playback tick rates, so skip them if the last update was recent
+        now = time.monotonic_ns()
+        if now - self._last_ui_emit_ns >= self.UI_UPDATE_INTERVAL_NS:
+            self._last_ui_emit_ns = now
+            dp = points[index]
+
+            # Calculate progress
+            progress = int((index / len(points)) * 100)
+            self.progress_changed.emit(progress)
+
+            # Emit current data for UI display
+            self.data_updated.emit({
+                'time_s': dp.time_s,
+                'voltage': dp.voltage_V,
+                'current': dp.current_A,
+                'soc': dp.soc_pct,
+                'soh': dp.soh_pct,
+                'speed': dp.speed_kmh,
+                'mileage': dp.current_mileage_km,
+                'gear': dp.gear,
+            })
+
+            # Update status bar
+            self.status_message.emit(self.STATUS_TEMPLATE % (
+                self._profile.name, dp.soc_pct, dp.voltage_V, dp.current_A,
+                dp.speed_kmh, self._playback_speed))
 
         # Advance index — skip data points based on playback speed
         # At 1x: 250ms interval, profile at 1Hz → advance ~0.25 points per tick